@@ -30,11 +30,34 @@ _DEFAULT_WASM_PATH = os.path.join(
 )
 
 JSL_RESULT_SIZE = 12  # 3 × u32 (LE)
+_JSL_RESULT = struct.Struct("<III")
 EXPECTED_ABI_VERSION = 1
 STATUS_OK = 0
 STATUS_ERROR = 1
 
 
+def _dumps(value: Any) -> str:
+    """Serialize to minified JSON — no whitespace to copy into guest memory."""
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _engine_config(compile_cache: bool) -> wasmtime.Config:
+    """wasmtime Config, with the on-disk compilation cache if requested.
+
+    The cache lets separate processes (e.g. a worker pool) reuse one
+    Cranelift compilation of the module. Falls back to no cache if it
+    can't be loaded.
+    """
+    config = wasmtime.Config()
+    if not compile_cache:
+        return config
+    try:
+        config.cache = True
+    except wasmtime.WasmtimeError:
+        config = wasmtime.Config()
+    return config
+
+
 class JslError(Exception):
     """Structured error from the WASI binary."""
 
@@ -57,11 +80,15 @@ class SchemaLlmEngine:
 
             rehydrated = engine.rehydrate(data, codec, schema)
             restored = rehydrated.data
+
+    Pass ``compile_cache=True`` to enable wasmtime's on-disk compilation
+    cache (written under the user's cache directory), so engines in other
+    processes skip recompiling the module.
     """
 
-    def __init__(self, wasm_path: Optional[str] = None):
+    def __init__(self, wasm_path: Optional[str] = None, compile_cache: bool = False):
         path = wasm_path or os.environ.get("JSL_WASM_PATH", _DEFAULT_WASM_PATH)
-        self._engine = wasmtime.Engine()
+        self._engine = wasmtime.Engine(_engine_config(compile_cache))
         self._module = wasmtime.Module.from_file(self._engine, path)
         self._linker = wasmtime.Linker(self._engine)
         self._linker.define_wasi()
@@ -77,23 +104,23 @@ class SchemaLlmEngine:
         self, schema: Any, options: Optional[ConvertOptions] = None
     ) -> ConvertResult:
         """Convert a JSON Schema to LLM-compatible structured output schema."""
-        schema_json = json.dumps(schema)
+        schema_json = _dumps(schema)
         opts_dict = options.to_dict() if options else {}
-        opts_json = json.dumps(opts_dict)
+        opts_json = _dumps(opts_dict)
         raw = self._call_jsl("jsl_convert", schema_json, opts_json)
         return ConvertResult.from_dict(raw)
 
     def rehydrate(self, data: Any, codec: Any, schema: Any) -> RehydrateResult:
         """Rehydrate LLM output back to original schema shape."""
-        data_json = json.dumps(data)
-        codec_json = json.dumps(codec)
-        schema_json = json.dumps(schema)
+        data_json = _dumps(data)
+        codec_json = _dumps(codec)
+        schema_json = _dumps(schema)
         raw = self._call_jsl("jsl_rehydrate", data_json, codec_json, schema_json)
         return RehydrateResult.from_dict(raw)
 
     def list_components(self, schema: Any) -> ListComponentsResult:
         """List all extractable component JSON Pointers in a schema."""
-        schema_json = json.dumps(schema)
+        schema_json = _dumps(schema)
         raw = self._call_jsl("jsl_list_components", schema_json)
         return ListComponentsResult.from_dict(raw)
 
@@ -101,8 +128,8 @@ class SchemaLlmEngine:
         self, schema: Any, pointer: str, options: Optional[dict] = None
     ) -> ExtractComponentResult:
         """Extract a single component from a schema by JSON Pointer."""
-        schema_json = json.dumps(schema)
-        opts_json = json.dumps(options or {})
+        schema_json = _dumps(schema)
+        opts_json = _dumps(options or {})
         raw = self._call_jsl("jsl_extract_component", schema_json, pointer, opts_json)
         return ExtractComponentResult.from_dict(raw)
 
@@ -113,10 +140,10 @@ class SchemaLlmEngine:
         extract_options: Optional[dict] = None,
     ) -> ConvertAllComponentsResult:
         """Convert a schema and all its discoverable components in one call."""
-        schema_json = json.dumps(schema)
+        schema_json = _dumps(schema)
         conv_dict = convert_options.to_dict() if convert_options else {}
-        conv_opts_json = json.dumps(conv_dict)
-        ext_opts_json = json.dumps(extract_options or {})
+        conv_opts_json = _dumps(conv_dict)
+        ext_opts_json = _dumps(extract_options or {})
         raw = self._call_jsl(
             "jsl_convert_all_components", schema_json, conv_opts_json, ext_opts_json
         )
@@ -172,7 +199,7 @@ class SchemaLlmEngine:
 
             # Read JslResult (12 bytes: 3 × LE u32)
             result_bytes = memory.read(store, result_ptr, result_ptr + JSL_RESULT_SIZE)
-            status, payload_ptr, payload_len = struct.unpack("<III", result_bytes)
+            status, payload_ptr, payload_len = _JSL_RESULT.unpack(result_bytes)
 
             # Validate payload bounds
             mem_size = memory.data_len(store)
@@ -181,9 +208,9 @@ class SchemaLlmEngine:
                     f"payload out of bounds: ptr={payload_ptr} len={payload_len} memSize={mem_size}"
                 )
 
-            # Read and copy payload
+            # Read and parse payload (json.loads decodes UTF-8 bytes directly)
             payload_bytes = memory.read(store, payload_ptr, payload_ptr + payload_len)
-            payload = json.loads(payload_bytes.decode("utf-8"))
+            payload = json.loads(payload_bytes)
 
             if status == STATUS_ERROR:
                 raise JslError(
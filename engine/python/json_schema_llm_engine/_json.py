@@ -0,0 +1,49 @@
+"""JSON encoding/decoding helpers shared by the engine and provider formatters."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import jiter
+except ImportError:  # pragma: no cover - exercised only without the extra
+    jiter = None
+
+
+def loads(raw: str | bytes | bytearray) -> Any:
+    """Decode a provider response body.
+
+    Uses ``jiter`` (the Rust parser behind Pydantic v2) when installed via
+    the ``speedups`` extra, falling back to the stdlib ``json`` module.
+    Provider responses repeat the same keys (``type``, ``text``, ``role``)
+    many times, so jiter's key-string cache avoids most of the per-key
+    allocations ``json.loads`` would make. Like ``json.loads``, accepts
+    ``str`` or UTF-8 ``bytes``/``bytearray``.
+
+    Raises:
+        TypeError: If ``raw`` is not ``str``, ``bytes`` or ``bytearray``.
+        ValueError: If ``raw`` is not valid JSON (``json.JSONDecodeError``
+            is a ``ValueError`` subclass, as is jiter's error type).
+    """
+    if jiter is None:
+        return json.loads(raw)
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8")
+    elif isinstance(raw, bytearray):
+        raw = bytes(raw)
+    elif not isinstance(raw, bytes):
+        raise TypeError(
+            f"the JSON object must be str, bytes or bytearray, not {type(raw).__name__}"
+        )
+    return jiter.from_json(raw, cache_mode="keys")
+
+
+def dumps(value: Any) -> str:
+    """Encode to minified JSON.
+
+    No whitespace after separators. Non-ASCII text stays ``\\uXXXX``-escaped
+    so the result is pure ASCII: transports may hand ``LlmRequest.body`` to
+    ``http.client`` as a ``str``, which encodes it as latin-1.
+    """
+    return json.dumps(value, separators=(",", ":"))
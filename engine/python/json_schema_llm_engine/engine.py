@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import json
+import os
+import struct
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Optional
 
 import wasmtime
 
+from json_schema_llm_engine._json import dumps as dump_json
 from json_schema_llm_engine.exceptions import (
     RehydrationError,
     ResponseParsingError,
@@ -19,6 +24,7 @@ from json_schema_llm_engine.types import LlmRequest, ProviderConfig, RoundtripRe
 # ABI version expected from the WASI module
 _EXPECTED_ABI_VERSION = 1
 _RESULT_SIZE = 12  # 3 × u32 (status, ptr, len)
+_RESULT_STRUCT = struct.Struct("<III")
 _STATUS_OK = 0
 _STATUS_ERROR = 1
 
@@ -39,6 +45,9 @@ class LlmRoundtripEngine:
         wasm_path: Path to the json-schema-llm WASI binary. If None, uses
                    the JSON_SCHEMA_LLM_WASM_PATH environment variable or
                    falls back to importlib.resources.
+        compile_cache: Enable wasmtime's on-disk compilation cache so later
+                   engines and processes skip Cranelift compilation. Off by
+                   default: it writes to the user's cache directory.
 
     Example::
 
@@ -56,13 +65,13 @@ class LlmRoundtripEngine:
         config: ProviderConfig,
         transport: LlmTransport,
         wasm_path: Optional[str] = None,
+        compile_cache: bool = False,
     ) -> None:
         self._formatter = formatter
         self._config = config
         self._transport = transport
-        wasm_bytes = _resolve_wasm_bytes(wasm_path)
-        self._engine = wasmtime.Engine()
-        self._module = wasmtime.Module(self._engine, wasm_bytes)
+        self._engine = wasmtime.Engine(_engine_config(compile_cache))
+        self._module = wasmtime.Module(self._engine, _resolve_wasm_bytes(wasm_path))
 
     def generate(
         self,
@@ -85,7 +94,7 @@ class LlmRoundtripEngine:
 
         return self.generate_with_preconverted(
             schema_json=schema_json,
-            codec_json=json.dumps(codec),
+            codec_json=dump_json(codec),
             llm_schema=llm_schema,
             prompt=prompt,
         )
@@ -112,7 +121,7 @@ class LlmRoundtripEngine:
         # Step 1: Apply patch to schema via WASM
         patch_result = self._call_wasi("jsl_apply_patch", schema_json, patch_json)
         patched_schema = patch_result.get("schema", {})
-        patched_schema_json = json.dumps(patched_schema)
+        patched_schema_json = dump_json(patched_schema)
 
         # Step 2: Convert patched schema to LLM-compatible form
         convert_result = self._call_wasi("jsl_convert", patched_schema_json, "{}")
@@ -121,7 +130,7 @@ class LlmRoundtripEngine:
 
         return self.generate_with_preconverted(
             schema_json=patched_schema_json,
-            codec_json=json.dumps(codec),
+            codec_json=dump_json(codec),
             llm_schema=llm_schema,
             prompt=prompt,
         )
@@ -181,15 +190,12 @@ class LlmRoundtripEngine:
     def _validate(self, data: Any, schema_json: str) -> list[str]:
         """Validate data against JSON Schema using the jsonschema library."""
         try:
-            import jsonschema
             import jsonschema.exceptions
-
-            schema = json.loads(schema_json)
-            jsonschema.Draft202012Validator.check_schema(schema)
-            validator = jsonschema.Draft202012Validator(schema)
-            return [str(e.message) for e in validator.iter_errors(data)]
         except ImportError:
             return []
+        try:
+            validator = _validator_for(schema_json)
+            return [str(e.message) for e in validator.iter_errors(data)]
         except (
             jsonschema.exceptions.SchemaError,
             jsonschema.exceptions.UnknownType,
@@ -200,9 +206,11 @@ class LlmRoundtripEngine:
     # ─── WASI Internals ─────────────────────────────────────────────────
 
     def _call_wasi(self, func_name: str, *json_args: str) -> Any:
-        """Execute a WASI export following the JslResult protocol."""
-        import struct
+        """Execute a WASI export following the JslResult protocol.
 
+        Arguments are copied into guest memory as UTF-8 bytes; the result
+        payload is decoded straight from the memory buffer.
+        """
         store = wasmtime.Store(self._engine)
         store.set_wasi(wasmtime.WasiConfig())
         linker = wasmtime.Linker(self._engine)
@@ -246,7 +254,7 @@ class LlmRoundtripEngine:
 
             # Read result struct (12 bytes: 3 × LE u32)
             result_bytes = memory.read(store, result_ptr, result_ptr + _RESULT_SIZE)
-            status, payload_ptr, payload_len = struct.unpack("<III", result_bytes)
+            status, payload_ptr, payload_len = _RESULT_STRUCT.unpack(result_bytes)
 
             # Bounds check before payload read
             mem_size = memory.data_len(store)
@@ -255,9 +263,9 @@ class LlmRoundtripEngine:
                     f"payload out of bounds: ptr={payload_ptr} len={payload_len} memSize={mem_size}"
                 )
 
+            # json.loads detects UTF-8 itself — no intermediate str copy
             payload_bytes = memory.read(store, payload_ptr, payload_ptr + payload_len)
-            payload_str = payload_bytes.decode("utf-8")
-            payload = json.loads(payload_str)
+            payload = json.loads(payload_bytes)
 
             if status == _STATUS_ERROR:
                 error_msg = (
@@ -282,11 +290,39 @@ class LlmRoundtripEngine:
                 jsl_free(store, ptr, length)
 
 
+@lru_cache(maxsize=128)
+def _validator_for(schema_json: str) -> Any:
+    """Parse, metaschema-check, and build a Draft 2020-12 validator once per schema.
+
+    Keyed on the raw schema string: repeated roundtrips against the same
+    schema skip check_schema and validator construction entirely.
+    """
+    import jsonschema
+
+    schema = json.loads(schema_json)
+    jsonschema.Draft202012Validator.check_schema(schema)
+    return jsonschema.Draft202012Validator(schema)
+
+
+def _engine_config(compile_cache: bool) -> wasmtime.Config:
+    """Build the wasmtime Config, optionally with the on-disk compilation cache.
+
+    Cranelift compilation dominates engine construction; with the cache
+    enabled, subsequent processes (and engines) reuse the compiled artifact.
+    Falls back to an uncached config if the cache directory is unusable.
+    """
+    config = wasmtime.Config()
+    if not compile_cache:
+        return config
+    try:
+        config.cache = True
+    except wasmtime.WasmtimeError:
+        config = wasmtime.Config()
+    return config
+
+
 def _resolve_wasm_bytes(explicit: str | None) -> bytes:
     """Resolve WASM binary: explicit path → env var → importlib.resources."""
-    import os
-    from pathlib import Path
-
     # Tier 1: Explicit path
     if explicit:
         p = Path(explicit)
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
+from json_schema_llm_engine._json import dumps as dump_json
+from json_schema_llm_engine._json import loads as parse_json
 from json_schema_llm_engine.exceptions import ResponseParsingError
 from json_schema_llm_engine.types import LlmRequest, ProviderConfig
 
@@ -44,44 +45,43 @@ class ChatCompletionsFormatter:
         return LlmRequest(
             url=config.url,
             headers=headers,
-            body=json.dumps(request_body),
+            body=dump_json(request_body),
         )
 
     def extract_content(self, raw_response: str) -> str:
         try:
-            root = json.loads(raw_response)
-
-            choices = root.get("choices")
-            if not choices or not isinstance(choices, list):
-                raise ResponseParsingError(
-                    f"Chat Completions response missing 'choices' array: "
-                    f"{_truncate(raw_response)}"
-                )
-
-            message = choices[0].get("message")
-            if message is None:
-                raise ResponseParsingError(
-                    f"Chat Completions response missing 'choices[0].message': "
-                    f"{_truncate(raw_response)}"
-                )
-
-            content = message.get("content")
-            if content is None:
-                raise ResponseParsingError(
-                    f"Chat Completions response has null 'content': "
-                    f"{_truncate(raw_response)}"
-                )
-
-            if not isinstance(content, str):
-                raise ResponseParsingError(
-                    f"Chat Completions 'content' is not a string: "
-                    f"{_truncate(raw_response)}"
-                )
-
-            return content
-        except ResponseParsingError:
-            raise
-        except Exception as e:
+            root = parse_json(raw_response)
+        except (TypeError, ValueError) as e:
             raise ResponseParsingError(
                 f"Failed to parse Chat Completions response: {_truncate(raw_response)}"
             ) from e
+
+        choices = root.get("choices") if isinstance(root, dict) else None
+        if not choices or not isinstance(choices, list):
+            raise ResponseParsingError(
+                f"Chat Completions response missing 'choices' array: "
+                f"{_truncate(raw_response)}"
+            )
+
+        first = choices[0]
+        message = first.get("message") if isinstance(first, dict) else None
+        if not isinstance(message, dict):
+            raise ResponseParsingError(
+                f"Chat Completions response missing 'choices[0].message': "
+                f"{_truncate(raw_response)}"
+            )
+
+        content = message.get("content")
+        if content is None:
+            raise ResponseParsingError(
+                f"Chat Completions response has null 'content': "
+                f"{_truncate(raw_response)}"
+            )
+
+        if not isinstance(content, str):
+            raise ResponseParsingError(
+                f"Chat Completions 'content' is not a string: "
+                f"{_truncate(raw_response)}"
+            )
+
+        return content
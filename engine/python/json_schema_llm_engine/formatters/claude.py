@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
+from json_schema_llm_engine._json import dumps as dump_json
+from json_schema_llm_engine._json import loads as parse_json
 from json_schema_llm_engine.exceptions import ResponseParsingError
 from json_schema_llm_engine.types import LlmRequest, ProviderConfig
 
@@ -45,33 +46,31 @@ class ClaudeFormatter:
         return LlmRequest(
             url=config.url,
             headers=headers,
-            body=json.dumps(request_body),
+            body=dump_json(request_body),
         )
 
     def extract_content(self, raw_response: str) -> str:
         try:
-            root = json.loads(raw_response)
-
-            content = root.get("content")
-            if not content or not isinstance(content, list):
-                raise ResponseParsingError(
-                    f"Claude response missing 'content' array: "
-                    f"{_truncate(raw_response)}"
-                )
-
-            for block in content:
-                if block.get("type") == "tool_use":
-                    input_data = block.get("input")
-                    if input_data is not None:
-                        return json.dumps(input_data)
+            root = parse_json(raw_response)
+        except (TypeError, ValueError) as e:
+            raise ResponseParsingError(
+                f"Failed to parse Claude response: {_truncate(raw_response)}"
+            ) from e
 
+        content = root.get("content") if isinstance(root, dict) else None
+        if not content or not isinstance(content, list):
             raise ResponseParsingError(
-                f"Claude response contains no 'tool_use' content block: "
+                f"Claude response missing 'content' array: "
                 f"{_truncate(raw_response)}"
             )
-        except ResponseParsingError:
-            raise
-        except Exception as e:
-            raise ResponseParsingError(
-                f"Failed to parse Claude response: {_truncate(raw_response)}"
-            ) from e
+
+        for block in content:
+            if isinstance(block, dict) and block.get("type") == "tool_use":
+                input_data = block.get("input")
+                if input_data is not None:
+                    return dump_json(input_data)
+
+        raise ResponseParsingError(
+            f"Claude response contains no 'tool_use' content block: "
+            f"{_truncate(raw_response)}"
+        )
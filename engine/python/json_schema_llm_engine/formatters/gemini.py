@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
+from json_schema_llm_engine._json import dumps as dump_json
+from json_schema_llm_engine._json import loads as parse_json
 from json_schema_llm_engine.exceptions import ResponseParsingError
 from json_schema_llm_engine.types import LlmRequest, ProviderConfig
 
@@ -40,55 +41,58 @@ class GeminiFormatter:
         return LlmRequest(
             url=config.url,
             headers=headers,
-            body=json.dumps(request_body),
+            body=dump_json(request_body),
         )
 
     def extract_content(self, raw_response: str) -> str:
         try:
-            root = json.loads(raw_response)
-
-            candidates = root.get("candidates")
-            if not candidates or not isinstance(candidates, list):
-                raise ResponseParsingError(
-                    f"Gemini response missing 'candidates' array: "
-                    f"{_truncate(raw_response)}"
-                )
-
-            first = candidates[0]
-
-            # Check for safety block
-            finish_reason = first.get("finishReason")
-            if finish_reason == "SAFETY":
-                raise ResponseParsingError(
-                    f"Gemini response blocked by SAFETY filter: "
-                    f"{_truncate(raw_response)}"
-                )
-
-            content = first.get("content")
-            if content is None:
-                raise ResponseParsingError(
-                    f"Gemini response missing 'candidates[0].content': "
-                    f"{_truncate(raw_response)}"
-                )
-
-            parts = content.get("parts")
-            if not parts or not isinstance(parts, list):
-                raise ResponseParsingError(
-                    f"Gemini response missing 'candidates[0].content.parts': "
-                    f"{_truncate(raw_response)}"
-                )
-
-            text = parts[0].get("text")
-            if text is None or not isinstance(text, str):
-                raise ResponseParsingError(
-                    f"Gemini 'parts[0].text' is missing or not text: "
-                    f"{_truncate(raw_response)}"
-                )
-
-            return text
-        except ResponseParsingError:
-            raise
-        except Exception as e:
+            root = parse_json(raw_response)
+        except (TypeError, ValueError) as e:
             raise ResponseParsingError(
                 f"Failed to parse Gemini response: {_truncate(raw_response)}"
             ) from e
+
+        candidates = root.get("candidates") if isinstance(root, dict) else None
+        if not candidates or not isinstance(candidates, list):
+            raise ResponseParsingError(
+                f"Gemini response missing 'candidates' array: "
+                f"{_truncate(raw_response)}"
+            )
+
+        first = candidates[0]
+        if not isinstance(first, dict):
+            raise ResponseParsingError(
+                f"Gemini 'candidates[0]' is not an object: "
+                f"{_truncate(raw_response)}"
+            )
+
+        # Check for safety block
+        finish_reason = first.get("finishReason")
+        if finish_reason == "SAFETY":
+            raise ResponseParsingError(
+                f"Gemini response blocked by SAFETY filter: "
+                f"{_truncate(raw_response)}"
+            )
+
+        content = first.get("content")
+        if not isinstance(content, dict):
+            raise ResponseParsingError(
+                f"Gemini response missing 'candidates[0].content': "
+                f"{_truncate(raw_response)}"
+            )
+
+        parts = content.get("parts")
+        if not parts or not isinstance(parts, list):
+            raise ResponseParsingError(
+                f"Gemini response missing 'candidates[0].content.parts': "
+                f"{_truncate(raw_response)}"
+            )
+
+        text = parts[0].get("text") if isinstance(parts[0], dict) else None
+        if text is None or not isinstance(text, str):
+            raise ResponseParsingError(
+                f"Gemini 'parts[0].text' is missing or not text: "
+                f"{_truncate(raw_response)}"
+            )
+
+        return text
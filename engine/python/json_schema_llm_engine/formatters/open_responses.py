@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
+from json_schema_llm_engine._json import dumps as dump_json
+from json_schema_llm_engine._json import loads as parse_json
 from json_schema_llm_engine.exceptions import ResponseParsingError
 from json_schema_llm_engine.types import LlmRequest, ProviderConfig
 
@@ -43,37 +44,36 @@ class OpenResponsesFormatter:
         return LlmRequest(
             url=config.url,
             headers=headers,
-            body=json.dumps(request_body),
+            body=dump_json(request_body),
         )
 
     def extract_content(self, raw_response: str) -> str:
         try:
-            root = json.loads(raw_response)
-
-            output = root.get("output")
-            if not output or not isinstance(output, list):
-                raise ResponseParsingError(
-                    f"OpenResponses response missing 'output' array: "
-                    f"{_truncate(raw_response)}"
-                )
-
-            for item in output:
-                if item.get("type") == "message":
-                    content = item.get("content")
-                    if content and isinstance(content, list):
-                        for part in content:
-                            if part.get("type") == "output_text":
-                                text = part.get("text")
-                                if text and isinstance(text, str):
-                                    return text
+            root = parse_json(raw_response)
+        except (TypeError, ValueError) as e:
+            raise ResponseParsingError(
+                f"Failed to parse OpenResponses response: {_truncate(raw_response)}"
+            ) from e
 
+        output = root.get("output") if isinstance(root, dict) else None
+        if not output or not isinstance(output, list):
             raise ResponseParsingError(
-                f"OpenResponses response has no 'output_text': "
+                f"OpenResponses response missing 'output' array: "
                 f"{_truncate(raw_response)}"
             )
-        except ResponseParsingError:
-            raise
-        except Exception as e:
-            raise ResponseParsingError(
-                f"Failed to parse OpenResponses response: {_truncate(raw_response)}"
-            ) from e
+
+        for item in output:
+            if not isinstance(item, dict) or item.get("type") != "message":
+                continue
+            content = item.get("content")
+            if content and isinstance(content, list):
+                for part in content:
+                    if isinstance(part, dict) and part.get("type") == "output_text":
+                        text = part.get("text")
+                        if text and isinstance(text, str):
+                            return text
+
+        raise ResponseParsingError(
+            f"OpenResponses response has no 'output_text': "
+            f"{_truncate(raw_response)}"
+        )
@@ -156,6 +156,16 @@ class TestChatCompletionsFormatter:
         with pytest.raises(ResponseParsingError):
             formatter.extract_content("{}")
 
+    def test_extract_content_invalid_json_raises(self):
+        from json_schema_llm_engine.exceptions import ResponseParsingError
+        from json_schema_llm_engine.formatters.chat_completions import (
+            ChatCompletionsFormatter,
+        )
+
+        formatter = ChatCompletionsFormatter()
+        with pytest.raises(ResponseParsingError):
+            formatter.extract_content('{"choices": [')
+
 
 # ── OpenResponses Formatter ──────────────────────────────────────────────────
 
@@ -305,6 +315,14 @@ class TestGeminiFormatter:
         with pytest.raises(ResponseParsingError):
             formatter.extract_content("{}")
 
+    def test_extract_content_non_object_candidate_raises(self):
+        from json_schema_llm_engine.exceptions import ResponseParsingError
+        from json_schema_llm_engine.formatters.gemini import GeminiFormatter
+
+        formatter = GeminiFormatter()
+        with pytest.raises(ResponseParsingError):
+            formatter.extract_content(json.dumps({"candidates": ["oops"]}))
+
 
 # ── Transport Protocol ───────────────────────────────────────────────────────
 
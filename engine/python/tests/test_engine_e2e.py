@@ -19,6 +19,11 @@ from pathlib import Path
 
 import pytest
 
+from json_schema_llm_engine.engine import LlmRoundtripEngine
+from json_schema_llm_engine.exceptions import SchemaConversionError
+from json_schema_llm_engine.formatters.chat_completions import ChatCompletionsFormatter
+from json_schema_llm_engine.types import ProviderConfig, RoundtripResult
+
 
 # WASM binary path: env var → repo-relative fallback
 def _find_wasm_path() -> Path:
@@ -49,16 +54,20 @@ pytestmark = [pytest.mark.e2e, e2e]
 
 # ── Schemas ──────────────────────────────────────────────────────────────────
 
-PERSON_SCHEMA = json.dumps(
-    {
-        "type": "object",
-        "properties": {
-            "name": {"type": "string"},
-            "age": {"type": "integer", "minimum": 0},
-        },
-        "required": ["name", "age"],
-    }
-)
+# Parsed and serialized forms built once; the string is minified since it
+# is what gets copied into WASM linear memory.
+PERSON_SCHEMA_DICT = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "age": {"type": "integer", "minimum": 0},
+    },
+    "required": ["name", "age"],
+}
+PERSON_SCHEMA = json.dumps(PERSON_SCHEMA_DICT, separators=(",", ":"))
+
+ADA = {"name": "Ada", "age": 36}
+ADA_JSON = json.dumps(ADA, separators=(",", ":"))
 
 
 # ── Stub Transport ───────────────────────────────────────────────────────────
@@ -76,23 +85,34 @@ class StubTransport:
         return self._response
 
 
+# ── Fixtures ─────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """One engine per module so the WASM binary is compiled only once."""
+    return LlmRoundtripEngine(
+        formatter=ChatCompletionsFormatter(),
+        config=ProviderConfig(url="http://localhost", model="stub"),
+        transport=StubTransport("{}"),
+        wasm_path=str(_WASM_PATH),
+        compile_cache=True,
+    )
+
+
+@pytest.fixture(scope="module")
+def codec_json(engine) -> str:
+    """Serialized codec for PERSON_SCHEMA, converted once per module."""
+    return json.dumps(engine._call_wasi("jsl_convert", PERSON_SCHEMA, "{}")["codec"])
+
+
 # ── Tests ────────────────────────────────────────────────────────────────────
 
 
 class TestConvertRoundtrip:
     """Verify that _call_wasi("jsl_convert") works end-to-end with real WASM."""
 
-    def test_convert_returns_expected_keys(self) -> None:
-        from json_schema_llm_engine.engine import LlmRoundtripEngine
-
-        from json_schema_llm_engine.formatters.chat_completions import ChatCompletionsFormatter
-        from json_schema_llm_engine.types import ProviderConfig
-        engine = LlmRoundtripEngine(
-            formatter=ChatCompletionsFormatter(),
-            config=ProviderConfig(url="http://localhost", model="stub"),
-            transport=StubTransport("{}"),
-            wasm_path=str(_WASM_PATH),
-        )
+    def test_convert_returns_expected_keys(self, engine) -> None:
         result = engine._call_wasi("jsl_convert", PERSON_SCHEMA, "{}")
 
         assert "apiVersion" in result, f"Missing apiVersion: {result}"
@@ -101,17 +121,7 @@ class TestConvertRoundtrip:
         assert "codec" in result, f"Missing codec key: {result}"
         assert isinstance(result["schema"], dict)
 
-    def test_convert_schema_has_properties(self) -> None:
-        from json_schema_llm_engine.engine import LlmRoundtripEngine
-
-        from json_schema_llm_engine.formatters.chat_completions import ChatCompletionsFormatter
-        from json_schema_llm_engine.types import ProviderConfig
-        engine = LlmRoundtripEngine(
-            formatter=ChatCompletionsFormatter(),
-            config=ProviderConfig(url="http://localhost", model="stub"),
-            transport=StubTransport("{}"),
-            wasm_path=str(_WASM_PATH),
-        )
+    def test_convert_schema_has_properties(self, engine) -> None:
         result = engine._call_wasi("jsl_convert", PERSON_SCHEMA, "{}")
         schema = result["schema"]
 
@@ -122,50 +132,20 @@ class TestConvertRoundtrip:
 class TestRehydrateRoundtrip:
     """Verify convert → rehydrate round-trip with real WASM."""
 
-    def test_rehydrate_recovers_original_data(self) -> None:
-        from json_schema_llm_engine.engine import LlmRoundtripEngine
-
-        from json_schema_llm_engine.formatters.chat_completions import ChatCompletionsFormatter
-        from json_schema_llm_engine.types import ProviderConfig
-        engine = LlmRoundtripEngine(
-            formatter=ChatCompletionsFormatter(),
-            config=ProviderConfig(url="http://localhost", model="stub"),
-            transport=StubTransport("{}"),
-            wasm_path=str(_WASM_PATH),
-        )
-
-        # Step 1: Convert
-        convert_result = engine._call_wasi("jsl_convert", PERSON_SCHEMA, "{}")
-        codec_json = json.dumps(convert_result["codec"])
-
-        # Step 2: Rehydrate with known data
-        data_json = json.dumps({"name": "Ada", "age": 36})
+    def test_rehydrate_recovers_original_data(self, engine, codec_json) -> None:
         rehydrate_result = engine._call_wasi(
-            "jsl_rehydrate", data_json, codec_json, PERSON_SCHEMA
+            "jsl_rehydrate", ADA_JSON, codec_json, PERSON_SCHEMA
         )
 
         assert "apiVersion" in rehydrate_result
         assert "data" in rehydrate_result
-        assert rehydrate_result["data"]["name"] == "Ada"
-        assert rehydrate_result["data"]["age"] == 36
+        assert rehydrate_result["data"] == ADA
 
 
 class TestConvertErrorPropagates:
     """Verify that WASM errors propagate as SchemaConversionError."""
 
-    def test_invalid_json_raises_schema_conversion_error(self) -> None:
-        from json_schema_llm_engine.engine import LlmRoundtripEngine
-        from json_schema_llm_engine.exceptions import SchemaConversionError
-
-        from json_schema_llm_engine.formatters.chat_completions import ChatCompletionsFormatter
-        from json_schema_llm_engine.types import ProviderConfig
-        engine = LlmRoundtripEngine(
-            formatter=ChatCompletionsFormatter(),
-            config=ProviderConfig(url="http://localhost", model="stub"),
-            transport=StubTransport("{}"),
-            wasm_path=str(_WASM_PATH),
-        )
-
+    def test_invalid_json_raises_schema_conversion_error(self, engine) -> None:
         with pytest.raises(SchemaConversionError) as exc_info:
             engine._call_wasi("jsl_convert", "NOT VALID JSON", "{}")
 
@@ -177,22 +157,14 @@ class TestGenerateFullRoundtrip:
     """Full engine.generate() with real WASM + stub transport."""
 
     def test_generate_returns_valid_roundtrip_result(self) -> None:
-        from json_schema_llm_engine.engine import LlmRoundtripEngine
-        from json_schema_llm_engine.formatters.chat_completions import (
-            ChatCompletionsFormatter,
-        )
-        from json_schema_llm_engine.types import ProviderConfig, RoundtripResult
-
-        transport = StubTransport('{"name": "Ada", "age": 36}')
+        # A dedicated engine for the canned response; wasmtime's compilation
+        # cache keeps the second build of the module cheap.
         engine = LlmRoundtripEngine(
             formatter=ChatCompletionsFormatter(),
-            config=ProviderConfig(
-                url="https://api.openai.com/v1/chat/completions",
-                model="gpt-4o",
-                headers={"Authorization": "Bearer test-key"},
-            ),
-            transport=transport,
+            config=ProviderConfig(url="http://localhost", model="stub"),
+            transport=StubTransport(ADA_JSON),
             wasm_path=str(_WASM_PATH),
+            compile_cache=True,
         )
 
         result = engine.generate(
@@ -201,7 +173,6 @@ class TestGenerateFullRoundtrip:
         )
 
         assert isinstance(result, RoundtripResult)
-        assert result.data["name"] == "Ada"
-        assert result.data["age"] == 36
+        assert result.data == ADA
         assert result.is_valid is True
         assert result.validation_errors == []
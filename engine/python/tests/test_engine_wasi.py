@@ -13,6 +13,9 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from json_schema_llm_engine.engine import LlmRoundtripEngine, _validator_for
+from json_schema_llm_engine.types import ProviderConfig
+
 
 # ── Bug 1: WASI ABI parameter mismatch ──────────────────────────────────────
 
@@ -21,9 +24,6 @@ class TestGeneratePassesOptionsToConvert:
     """generate() must call _call_wasi("jsl_convert", schema_json, "{}") — 2 JSON args."""
 
     def test_generate_passes_two_json_args_to_convert(self):
-        from json_schema_llm_engine.engine import LlmRoundtripEngine
-        from json_schema_llm_engine.types import ProviderConfig
-
         schema_json = json.dumps(
             {"type": "object", "properties": {"name": {"type": "string"}}}
         )
@@ -101,9 +101,6 @@ class TestGenerateReadsSchemaKey:
     """generate() must read the 'schema' key, not 'data', from convert result."""
 
     def test_generate_uses_schema_key_from_convert_result(self):
-        from json_schema_llm_engine.engine import LlmRoundtripEngine
-        from json_schema_llm_engine.types import ProviderConfig
-
         schema_json = json.dumps(
             {"type": "object", "properties": {"name": {"type": "string"}}}
         )
@@ -174,8 +171,6 @@ class TestValidateSurfacesErrors:
     """_validate() must surface validation errors, not silently return []."""
 
     def test_validate_returns_errors_for_invalid_data(self):
-        from json_schema_llm_engine.engine import LlmRoundtripEngine
-
         engine = LlmRoundtripEngine.__new__(LlmRoundtripEngine)
 
         schema_json = json.dumps(
@@ -198,8 +193,6 @@ class TestValidateSurfacesErrors:
         )
 
     def test_validate_does_not_swallow_json_decode_error(self):
-        from json_schema_llm_engine.engine import LlmRoundtripEngine
-
         engine = LlmRoundtripEngine.__new__(LlmRoundtripEngine)
 
         # Malformed JSON should propagate, not be swallowed
@@ -207,8 +200,6 @@ class TestValidateSurfacesErrors:
             engine._validate({"name": "Alice"}, "NOT VALID JSON")
 
     def test_validate_graceful_on_missing_jsonschema(self):
-        from json_schema_llm_engine.engine import LlmRoundtripEngine
-
         engine = LlmRoundtripEngine.__new__(LlmRoundtripEngine)
 
         schema_json = json.dumps({"type": "object"})
@@ -225,8 +216,6 @@ class TestValidateSurfacesErrors:
 
     def test_validate_reports_schema_error(self):
         """SchemaError should appear as a synthetic validation error, not crash or be swallowed."""
-        from json_schema_llm_engine.engine import LlmRoundtripEngine
-
         engine = LlmRoundtripEngine.__new__(LlmRoundtripEngine)
 
         # A schema with an invalid value for 'type' will trigger SchemaError
@@ -241,3 +230,18 @@ class TestValidateSurfacesErrors:
 
         # Should NOT be empty — the schema error should be surfaced
         assert len(errors) > 0, "Expected schema error to be reported, got []"
+
+    def test_validate_reuses_validator_for_same_schema(self):
+        engine = LlmRoundtripEngine.__new__(LlmRoundtripEngine)
+
+        schema_json = json.dumps(
+            {"type": "object", "required": ["id"], "title": "reuse-check"}
+        )
+
+        _validator_for.cache_clear()
+        assert engine._validate({"id": 1}, schema_json) == []
+        assert len(engine._validate({}, schema_json)) == 1
+
+        info = _validator_for.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
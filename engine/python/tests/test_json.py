@@ -0,0 +1,61 @@
+"""Tests for the shared JSON helpers in json_schema_llm_engine._json."""
+
+import json
+
+import pytest
+
+from json_schema_llm_engine import _json
+from json_schema_llm_engine.exceptions import ResponseParsingError
+from json_schema_llm_engine.formatters.chat_completions import (
+    ChatCompletionsFormatter,
+)
+
+
+@pytest.fixture(params=["jiter", "stdlib"])
+def parser(request, monkeypatch):
+    """Run each loads() test with jiter (if installed) and the json fallback."""
+    if request.param == "jiter":
+        if _json.jiter is None:
+            pytest.skip("jiter not installed")
+    else:
+        monkeypatch.setattr(_json, "jiter", None)
+    return request.param
+
+
+class TestLoads:
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            '{"a": [1, "é"]}',
+            '{"a": [1, "é"]}'.encode(),
+            bytearray('{"a": [1, "é"]}'.encode()),
+        ],
+        ids=["str", "bytes", "bytearray"],
+    )
+    def test_accepts_str_and_utf8_bytes(self, parser, raw):
+        assert _json.loads(raw) == {"a": [1, "é"]}
+
+    def test_non_text_input_raises_type_error(self, parser):
+        with pytest.raises(TypeError):
+            _json.loads(None)
+
+    def test_invalid_json_raises_value_error(self, parser):
+        with pytest.raises(ValueError):
+            _json.loads(b'{"a": ')
+
+    def test_none_response_becomes_parsing_error(self, parser):
+        with pytest.raises(ResponseParsingError):
+            ChatCompletionsFormatter().extract_content(None)
+
+
+class TestDumps:
+    def test_non_ascii_is_escaped(self):
+        """http.client encodes str bodies as latin-1, so bodies must be ASCII."""
+        body = _json.dumps({"prompt": "你好", "name": "café"})
+
+        assert body.isascii()
+        body.encode("latin-1")
+        assert json.loads(body) == {"prompt": "你好", "name": "café"}
+
+    def test_output_is_minified(self):
+        assert _json.dumps({"a": [1, 2]}) == '{"a":[1,2]}'
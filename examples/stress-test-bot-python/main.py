@@ -6,22 +6,44 @@ Pipeline: convert → OpenAI structured output → rehydrate → validate.
 """
 
 import argparse
+import asyncio
 import json
 import os
+import re
 import sys
 import time
-from typing import Optional
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence, Union
 
 # Add WASI wrapper to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "bindings", "python"))
-from json_schema_llm_wasi import Engine, JslError  # noqa: E402
-from openai import OpenAI
+from json_schema_llm_wasi import ConvertOptions, JslError, SchemaLlmEngine  # noqa: E402
+import orjson
+from openai import AsyncOpenAI
 import jsonschema
 from jsonschema import Draft202012Validator
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse CLI arguments matching TS client interface."""
+def _jloads(data: Union[str, bytes], *, exact: bool = False) -> Any:
+    """Parse JSON text or UTF-8 bytes.
+
+    orjson rejects NaN, Infinity and out-of-range numbers such as 1e400,
+    which the json module accepts; those fall back to json.loads. orjson
+    also reads integers wider than 64 bits as floats, so ``exact=True``
+    always uses json for documents whose numbers must survive unchanged.
+    """
+    if not exact:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser matching the TS client interface."""
     parser = argparse.ArgumentParser(
         description="Stress test bot for json-schema-llm Python bindings"
     )
@@ -49,45 +71,64 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Directory containing JSON schemas (default: tests/schemas/stress)",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum schemas in flight at once (default: 4)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help=(
+            "Worker processes for WASI convert/rehydrate "
+            "(default: min(concurrency, CPU count))"
+        ),
+    )
+    return parser
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse and validate CLI arguments (defaults to sys.argv[1:])."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
 
     if args.count < 1:
         parser.error("--count must be a positive integer")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be a positive integer")
+    if args.jobs is None:
+        args.jobs = min(args.concurrency, os.cpu_count() or 1)
+    elif args.jobs < 1:
+        parser.error("--jobs must be a positive integer")
 
     return args
 
 
-def _to_int32(x: int) -> int:
-    """Truncate to signed 32-bit integer (JS `|0` operator)."""
-    x = x & 0xFFFFFFFF
-    return x - 0x100000000 if x >= 0x80000000 else x
-
-
-def _unsigned_rshift(val: int, n: int) -> int:
-    """JS `>>>` operator: unsigned right shift."""
-    return (val & 0xFFFFFFFF) >> n
-
-
-def _imul(a: int, b: int) -> int:
-    """JS `Math.imul`: 32-bit truncating multiply."""
-    return _to_int32((a & 0xFFFFFFFF) * (b & 0xFFFFFFFF))
+_U32 = 0xFFFFFFFF
 
 
 def _mulberry32(seed: int) -> callable:
-    """Mulberry32 PRNG — bit-exact port of the TS reference."""
-    s = _to_int32(seed)
+    """Mulberry32 PRNG — bit-exact port of the TS reference.
+
+    State is kept as an unsigned 32-bit int and every step is masked inline,
+    which matches the JS `|0` / `>>>` / `Math.imul` semantics bit-for-bit
+    without a Python call per operation.
+    """
+    s = seed & _U32
 
     def random() -> float:
         nonlocal s
-        s = _to_int32(s + 0x6D2B79F5)
-        t = _imul(s ^ _unsigned_rshift(s, 15), 1 | s)
-        t = _to_int32(t + _imul(t ^ _unsigned_rshift(t, 7), 61 | t) ^ t)
-        return _unsigned_rshift(t ^ _unsigned_rshift(t, 14), 0) / 4294967296
+        s = (s + 0x6D2B79F5) & _U32
+        t = ((s ^ (s >> 15)) * (s | 1)) & _U32
+        t = ((t + (((t ^ (t >> 7)) * (t | 61)) & _U32)) & _U32) ^ t
+        return (t ^ (t >> 14)) / 4294967296
 
     return random
 
 
-def fisher_yates_shuffle(arr: list[str], seed: Optional[int] = None) -> list[str]:
+def fisher_yates_shuffle(arr: Sequence[str], seed: Optional[int] = None) -> list[str]:
     """Fisher-Yates shuffle with mulberry32 PRNG. Matches TS reference."""
     import math
     import random as _random
@@ -104,29 +145,29 @@ def fisher_yates_shuffle(arr: list[str], seed: Optional[int] = None) -> list[str
     return copy
 
 
+@lru_cache(maxsize=4)
 def resolve_schemas_dir(schemas_dir: Optional[str]) -> str:
     """Resolve schema directory, defaulting to tests/schemas/stress from repo root."""
     if schemas_dir:
         return os.path.abspath(schemas_dir)
 
     # Walk up to find repo root (contains Cargo.toml)
-    d = os.path.dirname(os.path.abspath(__file__))
-    for _ in range(10):
-        if os.path.isfile(os.path.join(d, "Cargo.toml")):
-            return os.path.join(d, "tests", "schemas", "stress")
-        d = os.path.dirname(d)
+    for parent in Path(__file__).resolve().parents[:10]:
+        if (parent / "Cargo.toml").is_file():
+            return str(parent / "tests" / "schemas" / "stress")
 
     print("Error: could not locate repo root. Use --schemas-dir.", file=sys.stderr)
     sys.exit(1)
 
 
-def load_schema_files(schemas_dir: str) -> list[str]:
-    """Load and return sorted list of .json files in the schemas directory."""
+@lru_cache(maxsize=4)
+def load_schema_files(schemas_dir: str) -> tuple[str, ...]:
+    """Load and return sorted .json filenames in the schemas directory."""
     if not os.path.isdir(schemas_dir):
         print(f"Error: schema directory not found: {schemas_dir}", file=sys.stderr)
         sys.exit(1)
 
-    files = sorted(f for f in os.listdir(schemas_dir) if f.endswith(".json"))
+    files = tuple(sorted(p.name for p in Path(schemas_dir).glob("*.json")))
     if not files:
         print(f"Error: no .json files found in {schemas_dir}", file=sys.stderr)
         sys.exit(1)
@@ -145,49 +186,142 @@ def describe_data(data: object) -> str:
     return f"{type(data).__name__}: {str(data)[:50]}"
 
 
+_INVALID_NAME_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+
+
 def sanitize_schema_name(name: str) -> str:
     """Sanitize name for OpenAI json_schema.name: ^[a-zA-Z0-9_-]+$ max 64 chars."""
-    sanitized = "".join(c if c.isalnum() or c in "_-" else "_" for c in name)
-    return sanitized[:64] or "schema"
+    return _INVALID_NAME_CHARS.sub("_", name[:64]) or "schema"
+
+
+# Canonical (sorted-key) schema JSON -> validator for that schema.
+_VALIDATORS: dict[str, Draft202012Validator] = {}
+
+
+def _validator_for(schema: dict) -> Draft202012Validator:
+    """Build (and metaschema-check) a validator once per distinct schema.
+
+    Looked up by canonical JSON, but built from ``schema`` as loaded:
+    validation follows the schema's key order, so the error reported is the
+    same as for an uncached validator.
+    """
+    # json, not orjson: it encodes every value json.loads can produce.
+    key = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        Draft202012Validator.check_schema(schema)
+        # setdefault: concurrent builds on worker threads keep one validator.
+        validator = _VALIDATORS.setdefault(key, Draft202012Validator(schema))
+    return validator
+
+
+# ─── WASI worker pool ───────────────────────────────────────────────────
+
+_CONVERT_OPTIONS = ConvertOptions(
+    target="openai-strict",
+    polymorphism="any-of",
+    max_depth=50,
+    recursion_limit=3,
+)
+
+# Per-process engine, created by the pool initializer. A wasmtime Store is
+# not shareable across threads, but each worker process owns its own; the
+# compilation cache lets all but the first skip compiling the module.
+_ENGINE: Optional[SchemaLlmEngine] = None
 
 
-def test_schema(
-    engine: Engine,
+def _worker_init() -> None:
+    global _ENGINE
+    _ENGINE = SchemaLlmEngine(compile_cache=True)
+
+
+def _worker_call(method: str, *args: Any) -> tuple[bool, Any]:
+    """Run a SchemaLlmEngine method in a pool worker.
+
+    JslError can't round-trip through pickle (its __init__ takes three
+    fields), so failures come back as a tagged (code, message, path) tuple.
+    """
+    try:
+        return True, getattr(_ENGINE, method)(*args)
+    except JslError as e:
+        return False, (e.code, e.message, e.path)
+
+
+async def _wasi(pool: Executor, method: str, *args: Any) -> Any:
+    """Await a SchemaLlmEngine method on the worker pool, re-raising JslError locally."""
+    loop = asyncio.get_running_loop()
+    ok, value = await loop.run_in_executor(pool, _worker_call, method, *args)
+    if not ok:
+        raise JslError(*value)
+    return value
+
+
+async def _read_stream(stream: Any) -> str:
+    """Concatenate the content deltas of a chat completion stream.
+
+    The stream is closed on every path, including errors mid-stream and
+    cancellation.
+    """
+    chunks: list[str] = []
+    async with stream:
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                chunks.append(chunk.choices[0].delta.content)
+    return "".join(chunks)
+
+
+async def test_schema(
+    pool: Executor,
     filename: str,
     schemas_dir: str,
-    client: OpenAI,
+    client: AsyncOpenAI,
     model: str,
+    semaphore: asyncio.Semaphore,
+) -> tuple[bool, float]:
+    """Run full pipeline for a single schema. Returns (passed, elapsed_seconds).
+
+    Progress lines are buffered and printed as one block when the schema
+    finishes, so concurrent runs don't interleave their output.
+    """
+    lines = [f"\n=== Testing {filename} ==="]
+    async with semaphore:
+        try:
+            return await _run_pipeline(
+                pool, filename, schemas_dir, client, model, lines.append
+            )
+        finally:
+            print("\n".join(lines))
+
+
+async def _run_pipeline(
+    pool: Executor,
+    filename: str,
+    schemas_dir: str,
+    client: AsyncOpenAI,
+    model: str,
+    log: Callable[[str], None],
 ) -> tuple[bool, float]:
-    """Run full pipeline for a single schema. Returns (passed, elapsed_seconds)."""
-    print(f"\n=== Testing {filename} ===")
     start_time = time.monotonic()
 
     schema_path = os.path.join(schemas_dir, filename)
-    with open(schema_path, encoding="utf-8") as f:
-        original_schema = json.load(f)
+    with open(schema_path, "rb") as f:
+        original_schema = _jloads(f.read(), exact=True)
 
     try:
-        # 1. Convert (WASI wrapper)
-        print("  converting...")
-        result = engine.convert(
-            original_schema,
-            {
-                "target": "openai-strict",
-                "polymorphism": "any-of",
-                "max-depth": 50,
-                "recursion-limit": 3,
-            },
-        )
+        # 1. Convert (WASI wrapper, on the worker pool)
+        log("  converting...")
+        result = await _wasi(pool, "convert", original_schema, _CONVERT_OPTIONS)
 
-        converted_schema = result["schema"]
-        codec = result["codec"]
+        converted_schema = result.schema
+        codec = result.codec
 
         # 2. Call OpenAI
         schema_name = "stress_test"
 
-        print(f"  calling {model}...")
-        response = client.chat.completions.create(
+        log(f"  calling {model}...")
+        stream = await client.chat.completions.create(
             model=model,
+            stream=True,
             messages=[
                 {
                     "role": "system",
@@ -205,63 +339,111 @@ def test_schema(
             },
         )
 
-        raw_content = response.choices[0].message.content
+        # Build the validator on a worker thread while tokens arrive instead
+        # of after the full response is in (boolean schemas need none). If
+        # the build fails, cancel the read so the stream is closed here
+        # rather than left to an orphaned task.
+        read_task = asyncio.ensure_future(_read_stream(stream))
+        try:
+            validator = (
+                await asyncio.to_thread(_validator_for, original_schema)
+                if isinstance(original_schema, dict)
+                else None
+            )
+        except BaseException:
+            read_task.cancel()
+            await asyncio.gather(read_task, return_exceptions=True)
+            raise
+        raw_content = await read_task
         if not raw_content:
             raise RuntimeError("No content from OpenAI")
 
-        llm_data = json.loads(raw_content)
+        llm_data = _jloads(raw_content)
 
         # 3. Rehydrate (WASI wrapper)
-        print("  rehydrating...")
-        rh_result = engine.rehydrate(llm_data, codec, original_schema)
+        log("  rehydrating...")
+        rh_result = await _wasi(pool, "rehydrate", llm_data, codec, original_schema)
 
-        if rh_result.get("warnings"):
-            print(f"  Warnings: {rh_result['warnings']}")
+        if rh_result.warnings:
+            log(f"  Warnings: {[w.msg for w in rh_result.warnings]}")
 
-        rehydrated_data = rh_result["data"]
+        rehydrated_data = rh_result.data
 
         # 4. Validate against original schema
         if original_schema is True:
-            print("  ✅ Boolean schema (true) — any data valid")
+            log("  ✅ Boolean schema (true) — any data valid")
         elif original_schema is False:
-            print("  ❌ Boolean schema (false) — no valid data possible")
+            log("  ❌ Boolean schema (false) — no valid data possible")
             elapsed = time.monotonic() - start_time
             return False, elapsed
-        elif isinstance(original_schema, dict):
-            Draft202012Validator.check_schema(original_schema)
-            validator = Draft202012Validator(original_schema)
+        elif validator is not None:
             validator.validate(rehydrated_data)
-            print("  ✅ Validated against original schema")
+            log("  ✅ Validated against original schema")
 
         # 5. Success
         elapsed = time.monotonic() - start_time
-        print(f"  ✅ Success! Rehydrated data: {describe_data(rehydrated_data)}")
-        print(f"  ⏱  {elapsed:.2f}s")
+        log(f"  ✅ Success! Rehydrated data: {describe_data(rehydrated_data)}")
+        log(f"  ⏱  {elapsed:.2f}s")
         return True, elapsed
 
     except JslError as e:
         elapsed = time.monotonic() - start_time
-        print(f"  ❌ FAIL: {e.message}")
+        log(f"  ❌ FAIL: {e.message}")
         if e.code:
-            print(f"     Code: {e.code}")
+            log(f"     Code: {e.code}")
         if e.path:
-            print(f"     Path: {e.path}")
-        print(f"  ⏱  {elapsed:.2f}s")
+            log(f"     Path: {e.path}")
+        log(f"  ⏱  {elapsed:.2f}s")
         return False, elapsed
 
     except jsonschema.ValidationError as e:
         elapsed = time.monotonic() - start_time
-        print(f"  ❌ Validation failed: {e.message}")
-        print(f"  ⏱  {elapsed:.2f}s")
+        log(f"  ❌ Validation failed: {e.message}")
+        log(f"  ⏱  {elapsed:.2f}s")
         return False, elapsed
 
     except Exception as e:
         elapsed = time.monotonic() - start_time
-        print(f"  ❌ FAIL: {e}")
-        print(f"  ⏱  {elapsed:.2f}s")
+        log(f"  ❌ FAIL: {e}")
+        log(f"  ⏱  {elapsed:.2f}s")
         return False, elapsed
 
 
+async def run_all(
+    test_files: list[str],
+    schemas_dir: str,
+    model: str,
+    concurrency: int,
+    jobs: int,
+    *,
+    client: Optional[AsyncOpenAI] = None,
+    pool: Optional[Executor] = None,
+) -> list[tuple[bool, float]]:
+    """Run every schema through the pipeline with at most `concurrency` in flight.
+
+    OpenAI calls overlap on the event loop; WASI work is spread over `jobs`
+    worker processes, each holding its own SchemaLlmEngine. ``client`` and
+    ``pool`` default to a fresh AsyncOpenAI and process pool; tests pass
+    their own.
+    """
+    if client is None:
+        client = AsyncOpenAI()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(executor: Executor) -> list[tuple[bool, float]]:
+        return await asyncio.gather(
+            *(
+                test_schema(executor, f, schemas_dir, client, model, semaphore)
+                for f in test_files
+            )
+        )
+
+    if pool is not None:
+        return await run(pool)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_worker_init) as executor:
+        return await run(executor)
+
+
 def main() -> None:
     """Entry point — parse args, run pipeline, report results."""
     args = parse_args()
@@ -275,25 +457,27 @@ def main() -> None:
 
     print(
         f"Testing {len(test_files)}/{len(all_files)} schemas "
-        f"(model={args.model}, seed={args.seed or 'random'})"
+        f"(model={args.model}, seed={args.seed or 'random'}, "
+        f"concurrency={args.concurrency}, jobs={args.jobs})"
     )
 
     if not os.environ.get("OPENAI_API_KEY"):
         print("Error: OPENAI_API_KEY environment variable not set.", file=sys.stderr)
         sys.exit(1)
 
-    client = OpenAI()
+    wall_start = time.monotonic()
+    results = asyncio.run(
+        run_all(test_files, schemas_dir, args.model, args.concurrency, args.jobs)
+    )
+    wall_time = time.monotonic() - wall_start
 
-    passed = 0
-    total_time = 0.0
-    with Engine() as engine:
-        for f in test_files:
-            ok, elapsed = test_schema(engine, f, schemas_dir, client, args.model)
-            total_time += elapsed
-            if ok:
-                passed += 1
+    passed = sum(1 for ok, _ in results if ok)
+    total_time = sum(elapsed for _, elapsed in results)
 
-    print(f"\n\nSummary: {passed}/{len(test_files)} passed ({total_time:.2f}s total).")
+    print(
+        f"\n\nSummary: {passed}/{len(test_files)} passed "
+        f"({total_time:.2f}s total, {wall_time:.2f}s wall)."
+    )
     if passed < len(test_files):
         sys.exit(1)
 
@@ -4,12 +4,20 @@ Validates CLI parsing, schema loading, and binding integration
 without making any LLM API calls.
 """
 
+import asyncio
+import contextlib
+import io
+import json
 import os
-import subprocess
-import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+import main
+from main import build_parser, parse_args
 
 
-SCRIPT_PATH = os.path.join(os.path.dirname(__file__), "main.py")
 SCHEMAS_DIR = os.path.join(
     os.path.dirname(__file__), "..", "..", "tests", "schemas", "stress"
 )
@@ -19,24 +27,30 @@ class TestCliParsing:
     """Verify CLI argument handling matches TS client interface."""
 
     def test_help_flag_exits_zero(self):
-        result = subprocess.run(
-            [sys.executable, SCRIPT_PATH, "--help"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-        assert "--count" in result.stdout
-        assert "--seed" in result.stdout
-        assert "--model" in result.stdout
-        assert "--schemas-dir" in result.stdout
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout), pytest.raises(SystemExit) as exc:
+            build_parser().parse_args(["--help"])
+        assert exc.value.code == 0
+        help_text = stdout.getvalue()
+        assert "--count" in help_text
+        assert "--seed" in help_text
+        assert "--model" in help_text
+        assert "--schemas-dir" in help_text
 
     def test_invalid_count_exits_nonzero(self):
-        result = subprocess.run(
-            [sys.executable, SCRIPT_PATH, "--count", "-1"],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode != 0
+        with (
+            contextlib.redirect_stderr(io.StringIO()),
+            pytest.raises(SystemExit) as exc,
+        ):
+            parse_args(["--count", "-1"])
+        assert exc.value.code != 0
+
+    def test_jobs_defaults_to_concurrency_capped_by_cpu_count(self):
+        args = parse_args(["--concurrency", "1"])
+        assert args.jobs == 1
+        args = parse_args(["--concurrency", "10000"])
+        assert args.jobs == (os.cpu_count() or 1)
+        assert parse_args(["--jobs", "3"]).jobs == 3
 
 
 class TestSchemaLoading:
@@ -50,6 +64,116 @@ class TestSchemaLoading:
         assert len(files) > 0
 
 
+class _FakeEngine:
+    """Stands in for SchemaLlmEngine: identity convert and rehydrate.
+
+    Results are attribute-only, like the bindings' ConvertResult and
+    RehydrateResult dataclasses.
+    """
+
+    def convert(self, schema, options):
+        assert options is main._CONVERT_OPTIONS
+        return SimpleNamespace(schema=schema, codec={})
+
+    def rehydrate(self, data, codec, schema):
+        return SimpleNamespace(data=data, warnings=[])
+
+
+class _FakeStream:
+    """Yields ``content`` in two deltas; ``None`` never yields at all."""
+
+    def __init__(self, content):
+        self._content = content
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+
+    async def __aiter__(self):
+        if self._content is None:
+            await asyncio.Event().wait()
+        for c in (self._content[:5], self._content[5:]):
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=c))]
+            )
+
+
+class _FakeAsyncOpenAI:
+    def __init__(self, content):
+        self._content = content
+        self.streams = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        assert kwargs["stream"] is True
+        stream = _FakeStream(self._content)
+        self.streams.append(stream)
+        return stream
+
+
+class TestRunAll:
+    """Drive run_all end to end with a fake OpenAI client and a thread pool."""
+
+    def test_results_follow_schema_order(self, tmp_path, monkeypatch):
+        name_schema = {
+            "type": "object",
+            "properties": {"name": {"type": "string"}},
+            "required": ["name"],
+        }
+        int_schema = {
+            "type": "object",
+            "properties": {"name": {"type": "integer"}},
+            "required": ["name"],
+        }
+        (tmp_path / "a.json").write_text(json.dumps(name_schema))
+        (tmp_path / "b.json").write_text(json.dumps(int_schema))
+
+        monkeypatch.setattr(main, "_ENGINE", _FakeEngine())
+        client = _FakeAsyncOpenAI('{"name": "Ada"}')
+        with (
+            ThreadPoolExecutor(max_workers=2) as pool,
+            contextlib.redirect_stdout(io.StringIO()) as out,
+        ):
+            results = asyncio.run(
+                main.run_all(
+                    ["a.json", "b.json"],
+                    str(tmp_path),
+                    "test-model",
+                    2,
+                    2,
+                    client=client,
+                    pool=pool,
+                )
+            )
+
+        assert [ok for ok, _ in results] == [True, False]
+        assert len(client.streams) == 2
+        assert all(stream.closed for stream in client.streams)
+        assert "Validation failed" in out.getvalue()
+
+    def test_validator_error_closes_pending_stream(self, tmp_path, monkeypatch):
+        (tmp_path / "bad.json").write_text(json.dumps({"type": 12}))
+
+        monkeypatch.setattr(main, "_ENGINE", _FakeEngine())
+        client = _FakeAsyncOpenAI(None)
+        lines = []
+
+        async def run():
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                ok, _ = await main._run_pipeline(
+                    pool, "bad.json", str(tmp_path), client, "m", lines.append
+                )
+            # Checked before asyncio.run tears down any leftover tasks.
+            assert client.streams[0].closed
+            return ok
+
+        assert asyncio.run(run()) is False
+        assert any("FAIL" in line for line in lines)
+
+
 class TestBindingIntegration:
     """Verify PyO3 binding is importable and functional."""
 
@@ -8,8 +8,14 @@ import argparse
 import json
 import os
 import sys
+from collections import Counter
 from dataclasses import asdict, dataclass, field
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib parser
+    orjson = None
+
 
 @dataclass
 class ComparisonResult:
@@ -44,44 +50,80 @@ def load_report(path):
     if not os.path.exists(path):
         raise FileNotFoundError(f"Report not found: {path}")
     try:
-        with open(path) as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+        return orjson.loads(raw) if orjson else json.loads(raw)
     except json.JSONDecodeError as e:
         print(f"Error: invalid JSON in {path}: {e}", file=sys.stderr)
         sys.exit(2)
 
 
+_PASSING = frozenset({"solid_pass", "flaky_pass", "unexpected_pass"})
+
+
 def _extract_verdicts(report):
     """Extract schema base_name → classification from detailed_results.
 
-    Falls back to verdict if classification not present.
+    Falls back to verdict if classification not present. The pass rate is
+    computed from per-label counts (one step per distinct verdict, not per
+    schema); expected failures are excluded from the denominator to match
+    the definition used by the CLI test runner.
+
+    Returns:
+        Tuple of (verdicts dict, pass rate as a percentage).
     """
     verdicts = {}
-    for entry in report.get("detailed_results", []):
+    for entry in report.get("detailed_results", ()):
         file_name = entry.get("file")
         if not file_name:
             continue
-        base_name = os.path.splitext(file_name)[0]
-        verdicts[base_name] = entry.get("classification", entry.get("verdict"))
-    return verdicts
-
-
-_PASSING = frozenset({"solid_pass", "flaky_pass", "unexpected_pass"})
-
-
-def _pass_rate(verdicts):
-    """Compute pass rate as a percentage.
-
-    Expected failures are excluded from the denominator to match the
-    definition used by the CLI test runner.
-    """
-    if not verdicts:
-        return 0.0
-    tested = {k: v for k, v in verdicts.items() if v != "expected_fail"}
-    if not tested:
-        return 0.0
-    passing = sum(1 for v in tested.values() if v in _PASSING)
-    return (passing / len(tested)) * 100.0
+        base_name, dot, _ = file_name.rpartition(".")
+        if not dot:
+            base_name = file_name
+        verdict = entry.get("classification")
+        if verdict is None:
+            verdict = entry.get("verdict")
+        verdicts[base_name] = verdict
+
+    # Counter tallies the values in C; the loop below is over labels only.
+    counts = Counter(verdicts.values())
+    counts.pop("expected_fail", None)
+    tested = sum(counts.values())
+    passing = sum(n for label, n in counts.items() if label in _PASSING)
+    pass_rate = (passing / tested) * 100.0 if tested else 0.0
+    return verdicts, pass_rate
+
+
+def _classify_transition(old, new):
+    """Name the ComparisonResult bucket for a verdict change old → new."""
+    if old == new:
+        return "unchanged"
+    # Fixes: expected_fail → any pass
+    if old == "expected_fail" and new in _PASSING:
+        return "fixes"
+    # Config drift: unexpected_pass → solid_pass (config needs updating)
+    if old == "unexpected_pass" and new == "solid_pass":
+        return "config_drift"
+    # New flaky: stable pass → flaky
+    if old == "solid_pass" and new == "flaky_pass":
+        return "new_flaky"
+    # New failures: was passing → now failing
+    if old in _PASSING and new not in _PASSING:
+        return "new_failures"
+    # New passes: was failing → now passing
+    if old not in _PASSING and new in _PASSING:
+        return "new_passes"
+    # Other transitions (e.g., solid_fail → expected_fail)
+    return "other_transitions"
+
+
+# Every pair of verdicts the CLI runner emits, resolved once at import.
+# Unknown labels fall back to _classify_transition.
+_VERDICTS = _PASSING | {"solid_fail", "expected_fail"}
+_TRANSITIONS = {
+    (old, new): _classify_transition(old, new) for old in _VERDICTS for new in _VERDICTS
+}
 
 
 def compare_reports(baseline, current):
@@ -94,46 +136,42 @@ def compare_reports(baseline, current):
     Returns:
         ComparisonResult with categorized transitions.
     """
-    base_verdicts = _extract_verdicts(baseline)
-    curr_verdicts = _extract_verdicts(current)
-
-    base_keys = set(base_verdicts)
-    curr_keys = set(curr_verdicts)
+    base_verdicts, base_rate = _extract_verdicts(baseline)
+    curr_verdicts, curr_rate = _extract_verdicts(current)
+
+    # One pass over each side partitions the keys; no intermediate sets.
+    common = []
+    baseline_only = []
+    for schema in base_verdicts:
+        (common if schema in curr_verdicts else baseline_only).append(schema)
+    current_only = [s for s in curr_verdicts if s not in base_verdicts]
+    baseline_only.sort()
+    current_only.sort()
 
     result = ComparisonResult(
-        baseline_pass_rate=_pass_rate(base_verdicts),
-        current_pass_rate=_pass_rate(curr_verdicts),
-        baseline_only=sorted(base_keys - curr_keys),
-        current_only=sorted(curr_keys - base_keys),
+        baseline_pass_rate=base_rate,
+        current_pass_rate=curr_rate,
+        baseline_only=baseline_only,
+        current_only=current_only,
     )
 
-    common = base_keys & curr_keys
-    for schema in sorted(common):
-        old = base_verdicts[schema]
-        new = curr_verdicts[schema]
-
-        if old == new:
-            result.unchanged.append(schema)
-            continue
-
-        # Fixes: expected_fail → any pass
-        if old == "expected_fail" and new in _PASSING:
-            result.fixes.append(schema)
-        # Config drift: unexpected_pass → solid_pass (config needs updating)
-        elif old == "unexpected_pass" and new == "solid_pass":
-            result.config_drift.append(schema)
-        # New flaky: stable pass → flaky
-        elif old == "solid_pass" and new == "flaky_pass":
-            result.new_flaky.append(schema)
-        # New failures: was passing → now failing
-        elif old in _PASSING and new not in _PASSING:
-            result.new_failures.append(schema)
-        # New passes: was failing → now passing
-        elif old not in _PASSING and new in _PASSING:
-            result.new_passes.append(schema)
-        else:
-            # Other transitions (e.g., solid_fail → expected_fail)
-            result.other_transitions.append(schema)
+    buckets = {
+        "unchanged": result.unchanged,
+        "fixes": result.fixes,
+        "config_drift": result.config_drift,
+        "new_flaky": result.new_flaky,
+        "new_failures": result.new_failures,
+        "new_passes": result.new_passes,
+        "other_transitions": result.other_transitions,
+    }
+    for schema in common:
+        key = (base_verdicts[schema], curr_verdicts[schema])
+        bucket = _TRANSITIONS.get(key) or _classify_transition(*key)
+        buckets[bucket].append(schema)
+    # Sorted so output (including --json, which lists "unchanged" in full)
+    # doesn't depend on report order, which --seed shuffles.
+    for schemas in buckets.values():
+        schemas.sort()
 
     return result
 
@@ -170,47 +208,20 @@ def format_comparison(result, json_output=False):
 
     lines = ["=== Stress Report Comparison ===", ""]
 
-    if result.new_failures:
-        lines.append(f"❌ New failures ({len(result.new_failures)}):")
-        for s in result.new_failures:
-            lines.append(f"  - {s}")
-        lines.append("")
-
-    if result.new_flaky:
-        lines.append(f"⚠️  New flaky ({len(result.new_flaky)}):")
-        for s in result.new_flaky:
-            lines.append(f"  - {s}")
-        lines.append("")
-
-    if result.new_passes:
-        lines.append(f"✅ New passes ({len(result.new_passes)}):")
-        for s in result.new_passes:
-            lines.append(f"  - {s}")
-        lines.append("")
-
-    if result.fixes:
-        lines.append(f"🔧 Fixes ({len(result.fixes)}):")
-        for s in result.fixes:
-            lines.append(f"  - {s}")
-        lines.append("")
-
-    if result.config_drift:
-        lines.append(f"📋 Config drift ({len(result.config_drift)}):")
-        for s in result.config_drift:
-            lines.append(f"  - {s}")
-        lines.append("")
-
-    if result.baseline_only:
-        lines.append(f"🗑️  Removed ({len(result.baseline_only)}):")
-        for s in result.baseline_only:
-            lines.append(f"  - {s}")
-        lines.append("")
-
-    if result.current_only:
-        lines.append(f"🆕 Added ({len(result.current_only)}):")
-        for s in result.current_only:
-            lines.append(f"  - {s}")
-        lines.append("")
+    sections = (
+        ("❌ New failures", result.new_failures),
+        ("⚠️  New flaky", result.new_flaky),
+        ("✅ New passes", result.new_passes),
+        ("🔧 Fixes", result.fixes),
+        ("📋 Config drift", result.config_drift),
+        ("🗑️  Removed", result.baseline_only),
+        ("🆕 Added", result.current_only),
+    )
+    for title, schemas in sections:
+        if schemas:
+            lines.append(f"{title} ({len(schemas)}):")
+            lines.extend([f"  - {s}" for s in schemas])
+            lines.append("")
 
     lines.append(f"Unchanged: {len(result.unchanged)} schemas")
     lines.append(
@@ -9,18 +9,38 @@ import argparse
 import json
 import os
 import random
+import re
+import sys
 
 OUTPUT_DIR = "tests/schemas/stress"
 
+# Paths written by the current main() run; counted in the summary line and
+# listed in one write with --verbose.
+_generated = []
+
+
+def _encode(schema):
+    """Serialize a fixture as 2-space indented JSON bytes.
+
+    Always json.dumps: orjson formats floats differently (1e-07 vs 1e-7,
+    1e+16 vs 1e16) and rejects integers wider than 64 bits, either of
+    which would churn or break the checked-in fixtures.
+    """
+    return json.dumps(schema, indent=2).encode()
+
 
 def write_schema(name, schema):
     # Auto-inject $schema for dict schemas when absent (Finding #1)
     if isinstance(schema, dict) and "$schema" not in schema:
         schema = {"$schema": "https://json-schema.org/draft/2020-12/schema", **schema}
     filename = os.path.join(OUTPUT_DIR, f"{name}.json")
-    with open(filename, "w") as f:
-        json.dump(schema, f, indent=2)
-    print(f"Generated: {filename}")
+    # Encode up front and write the bytes in one call, skipping the
+    # TextIOWrapper and json.dump's many small chunked writes. A buffered
+    # binary file retries short writes until every byte is written.
+    data = _encode(schema)
+    with open(filename, "wb") as f:
+        f.write(data)
+    _generated.append(filename)
 
 
 # --- Generators ---
@@ -32,36 +52,56 @@ def gen_deeply_nested(depth=50):
     The filename explicitly matches the depth argument.
     """
     schema = {"type": "string"}
-    for i in range(depth):
+    meta = {"type": "integer"}
+    for n in range(depth, 0, -1):
+        level = f"level_{n}"
         schema = {
             "type": "object",
-            "properties": {
-                f"level_{depth - i}": schema,
-                f"meta_{depth - i}": {"type": "integer"},
-            },
-            "required": [f"level_{depth - i}"],
+            "properties": {level: schema, f"meta_{n}": meta},
+            "required": [level],
         }
     write_schema(f"deep_nesting_{depth}", schema)
 
 
+def _kind_branch(i):
+    """Object branch tagged by ``kind: type_<i>``."""
+    return {
+        "type": "object",
+        "properties": {
+            "kind": {"const": f"type_{i}"},
+            "value": {"type": "string"},
+        },
+        "required": ["kind", "value"],
+        "additionalProperties": False,
+    }
+
+
+def tagged_union(tag_prop, branches, pointer):
+    """oneOf over object branches plus a discriminator on ``tag_prop``.
+
+    Each branch must pin ``tag_prop`` with a ``const``. The mapping points
+    every tag value at its branch (``pointer`` is the JSON Pointer of the
+    returned node), so a validator that honours the discriminator can pick
+    the branch by tag instead of trying them all.
+    """
+    mapping = {
+        branch["properties"][tag_prop]["const"]: f"{pointer}/oneOf/{i}"
+        for i, branch in enumerate(branches)
+    }
+    return {
+        "oneOf": branches,
+        "discriminator": {"propertyName": tag_prop, "mapping": mapping},
+    }
+
+
 def gen_heavy_polymorphism():
-    options = []
-    options.append({"type": "string", "maxLength": 5})
-    options.append({"type": "integer", "multipleOf": 5})
-    options.append({"type": "boolean"})
-    for i in range(5):
-        options.append(
-            {
-                "type": "object",
-                "properties": {
-                    "kind": {"const": f"type_{i}"},
-                    "value": {"type": "string"},
-                },
-                "required": ["kind", "value"],
-                "additionalProperties": False,
-            }
-        )
-    options.append({"type": "array", "items": {"type": "number"}, "minItems": 10})
+    options = [
+        {"type": "string", "maxLength": 5},
+        {"type": "integer", "multipleOf": 5},
+        {"type": "boolean"},
+        *(_kind_branch(i) for i in range(5)),
+        {"type": "array", "items": {"type": "number"}, "minItems": 10},
+    ]
     schema = {
         "$schema": "https://json-schema.org/draft/2020-12/schema",
         "type": "object",
@@ -71,6 +111,19 @@ def gen_heavy_polymorphism():
     write_schema("heavy_polymorphism_oneof", schema)
 
 
+def gen_polymorphism_tagged_union():
+    """The object branches of heavy_polymorphism_oneof as a tagged union."""
+    branches = [_kind_branch(i) for i in range(5)]
+    schema = {
+        "type": "object",
+        "properties": {
+            "poly_field": tagged_union("kind", branches, "#/properties/poly_field")
+        },
+        "required": ["poly_field"],
+    }
+    write_schema("polymorphism_tagged_union", schema)
+
+
 def gen_recursive_structures():
     # Linked list
     schema = {
@@ -112,6 +165,82 @@ def gen_recursive_structures():
     write_schema("recursive_mutual", schema_co)
 
 
+def gen_recursive_bounded(depth=5):
+    """Linked list unrolled to a fixed depth instead of a $ref cycle.
+
+    Bounded counterpart to recursive_linked_list: the innermost `next` is
+    `{"type": "null"}`, so consumers without cycle detection stay finite.
+    The filename matches the number of node levels.
+    """
+    value = {"type": "integer"}
+    node = {"type": "null"}
+    for _ in range(depth):
+        node = {
+            "type": "object",
+            "properties": {"value": value, "next": node},
+            "required": ["value"],
+        }
+    write_schema(f"recursive_bounded_{depth}", node)
+
+
+# `*`, `+` and `{n,}`: repetition with no upper bound.
+_UNBOUNDED_REPEAT = re.compile(r"\*|\+|\{\d*,\}")
+
+
+def _skip_char_class(pattern, i):
+    """Return the index just past the character class opening at `pattern[i]`."""
+    i += 1
+    if i < len(pattern) and pattern[i] == "^":
+        i += 1
+    if i < len(pattern) and pattern[i] == "]":
+        i += 1  # a leading `]` is a literal
+    while i < len(pattern) and pattern[i] != "]":
+        i += 2 if pattern[i] == "\\" else 1
+    return i + 1
+
+
+def _audit_regex(pattern):
+    """Return `pattern` after checking it compiles and can't blow up.
+
+    Fails generation (instead of a downstream validator) on a broken
+    pattern, or on a nested unbounded quantifier such as `(a+)+` or
+    `(\\d*x)*`: a group repeated without bound whose body can itself repeat
+    without bound, the shape behind exponential backtracking. The check is
+    static, so the result never depends on machine load.
+    """
+    re.compile(pattern)
+    # One flag per open group: does its body repeat without bound?
+    open_groups = [False]
+    closed_group_repeats = False  # flag of a group that just closed
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+        elif char == "[":
+            i = _skip_char_class(pattern, i)
+        elif char == "(":
+            open_groups.append(False)
+            i += 1
+        elif char == ")":
+            closed_group_repeats = open_groups.pop()
+            open_groups[-1] |= closed_group_repeats
+            i += 1
+            continue
+        elif match := _UNBOUNDED_REPEAT.match(pattern, i):
+            if closed_group_repeats:
+                raise ValueError(
+                    f"pattern backtracks catastrophically (nested unbounded "
+                    f"quantifier): {pattern!r}"
+                )
+            open_groups[-1] = True
+            i = match.end()
+        else:
+            i += 1
+        closed_group_repeats = False
+    return pattern
+
+
 def gen_string_constraints():
     patterns = [
         r"^[a-z]+$",
@@ -119,9 +248,10 @@ def gen_string_constraints():
         r"^(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$",
         r"^([0-9a-fA-F]{1,4}:){7,7}[0-9a-fA-F]{1,4}$",
     ]
-    props = {}
-    for i, pat in enumerate(patterns):
-        props[f"pattern_{i}"] = {"type": "string", "pattern": pat}
+    props = {
+        f"pattern_{i}": {"type": "string", "pattern": _audit_regex(pat)}
+        for i, pat in enumerate(patterns)
+    }
     props["email_format"] = {"type": "string", "format": "email"}
     props["uuid_format"] = {"type": "string", "format": "uuid"}
     schema = {"type": "object", "properties": props, "required": list(props.keys())}
@@ -426,12 +556,54 @@ def gen_scale_deep_array():
     write_schema("scale_deep_array", wrapper)
 
 
-def main(seed=42):
+def gen_combo_depth_width(depth, width):
+    """Chain of `depth` objects, each with `width` string items.
+
+    Built bottom-up so each level is a single dict literal; the item
+    properties are shared between levels since the schema is only dumped.
+    """
+    string = {"type": "string"}
+    items = {f"item_{w}": string for w in range(width)}
+    schema = {"type": "object", "properties": dict(items), "required": []}
+    for d in range(depth - 1, 0, -1):
+        level = f"level_{d}"
+        schema = {
+            "type": "object",
+            "properties": {**items, level: schema},
+            "required": [level],
+        }
+    schema = {
+        "type": "object",
+        "properties": {"level_0": schema},
+        "required": ["level_0"],
+    }
+    write_schema(f"combo_depth_{depth}_width_{width}", schema)
+
+
+def clean_output_dir():
+    """Remove generated .json fixtures from OUTPUT_DIR.
+
+    Returns:
+        Number of files removed.
+    """
+    removed = 0
+    # DirEntry.path is already joined, and scandir reuses the readdir data.
+    with os.scandir(OUTPUT_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json"):
+                os.unlink(entry.path)
+                removed += 1
+    return removed
+
+
+def main(seed=42, verbose=False):
     """Generate all stress test schemas.
 
     Args:
         seed: Random seed for deterministic generation. Default 42.
+        verbose: List every generated file (in a single write) at the end.
     """
+    _generated.clear()
     random.seed(seed)
     print(f"Generating stress test schemas (seed={seed})...")
 
@@ -440,7 +612,9 @@ def main(seed=42):
     # Core generators (deterministic)
     gen_deeply_nested(50)
     gen_heavy_polymorphism()
+    gen_polymorphism_tagged_union()
     gen_recursive_structures()
+    gen_recursive_bounded(5)
     gen_string_constraints()
     gen_numeric_constraints()
     gen_array_madness()
@@ -471,22 +645,7 @@ def main(seed=42):
     # Depth & Width variations
     for depth in [5, 10, 50]:
         for width in [2, 5]:
-            schema = {"type": "object", "properties": {}, "required": []}
-            current = schema
-            for d in range(depth):
-                prop = f"level_{d}"
-                current["properties"][prop] = {
-                    "type": "object",
-                    "properties": {},
-                    "required": [],
-                }
-                current["required"].append(prop)
-                for w in range(width):
-                    current["properties"][prop]["properties"][f"item_{w}"] = {
-                        "type": "string"
-                    }
-                current = current["properties"][prop]
-            write_schema(f"combo_depth_{depth}_width_{width}", schema)
+            gen_combo_depth_width(depth, width)
 
     # Array permutations (deterministic via seed)
     types = ["string", "integer", "boolean", "null"]
@@ -502,7 +661,22 @@ def main(seed=42):
         }
         write_schema(f"combo_array_tuple_{i}", schema)
 
-    # Polymorphism mixtures (oneOf nested in allOf)
+    # Polymorphism mixtures (oneOf nested in allOf). Only the `common` const
+    # varies, so the oneOf branch is built once and shared by every variant.
+    poly_branch = {
+        "oneOf": [
+            {
+                "type": "object",
+                "properties": {"a": {"type": "string"}},
+                "required": ["a"],
+            },
+            {
+                "type": "object",
+                "properties": {"b": {"type": "integer"}},
+                "required": ["b"],
+            },
+        ]
+    }
     for i in range(10):
         schema = {
             "allOf": [
@@ -511,20 +685,7 @@ def main(seed=42):
                     "properties": {"common": {"const": f"val_{i}"}},
                     "required": ["common"],
                 },
-                {
-                    "oneOf": [
-                        {
-                            "type": "object",
-                            "properties": {"a": {"type": "string"}},
-                            "required": ["a"],
-                        },
-                        {
-                            "type": "object",
-                            "properties": {"b": {"type": "integer"}},
-                            "required": ["b"],
-                        },
-                    ]
-                },
+                poly_branch,
             ]
         }
         write_schema(f"combo_poly_mix_{i}", schema)
@@ -535,6 +696,10 @@ def main(seed=42):
     write_schema("edge_empty", {})
     write_schema("edge_not_string", {"not": {"type": "string"}})
 
+    # Property maps below share one leaf: fixtures are only serialized, never
+    # mutated after construction.
+    string_schema = {"type": "string"}
+
     # Dangerous Property Names
     reserved = [
         "class",
@@ -550,7 +715,7 @@ def main(seed=42):
     ]
     schema = {
         "type": "object",
-        "properties": {k: {"type": "string"} for k in reserved},
+        "properties": dict.fromkeys(reserved, string_schema),
         "required": reserved,
     }
     write_schema("edge_reserved_words", schema)
@@ -559,12 +724,14 @@ def main(seed=42):
     unicode_keys = ["🚀", "你好", "☃️", "a list"]
     schema = {
         "type": "object",
-        "properties": {k: {"type": "string"} for k in unicode_keys},
+        "properties": dict.fromkeys(unicode_keys, string_schema),
         "required": unicode_keys,
     }
     write_schema("edge_unicode_keys", schema)
 
-    print(f"Done. Total schemas in {OUTPUT_DIR}: {len(os.listdir(OUTPUT_DIR))}")
+    if verbose:
+        sys.stdout.write("".join(f"Generated: {f}\n" for f in _generated))
+    print(f"Done. Wrote {len(_generated)} schemas to {OUTPUT_DIR}")
 
 
 if __name__ == "__main__":
@@ -577,10 +744,13 @@ if __name__ == "__main__":
         action="store_true",
         help="Remove existing schemas from output directory before generating",
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="List each generated schema file",
+    )
     args = parser.parse_args()
     if args.clean and os.path.isdir(OUTPUT_DIR):
-        for f in os.listdir(OUTPUT_DIR):
-            if f.endswith(".json"):
-                os.remove(os.path.join(OUTPUT_DIR, f))
-        print(f"Cleaned {OUTPUT_DIR}")
-    main(seed=args.seed)
+        removed = clean_output_dir()
+        print(f"Cleaned {removed} files from {OUTPUT_DIR}")
+    main(seed=args.seed, verbose=args.verbose)
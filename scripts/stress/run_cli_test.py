@@ -5,17 +5,51 @@ Results include per-stage classification with machine-readable reason codes.
 """
 
 import argparse
+import functools
 import json
 import os
 import random
 import re
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from openai import OpenAI
 import jsonschema
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib parser/encoder
+    orjson = None
+
+
+def _load_json(path, exact=False):
+    """Parse a JSON file, with orjson when it is installed.
+
+    orjson rejects some input the json module accepts (NaN, Infinity,
+    numbers like 1e400); that falls back to json.loads. It also reads
+    integers wider than 64 bits as floats, silently, so documents whose
+    numbers must survive unchanged (the schema and the data validated
+    against it) pass `exact=True` to always use json.
+
+    Raises:
+        json.JSONDecodeError: On invalid JSON.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if orjson and not exact:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+# Arguments that are the same for every conversion in a run.
+_CONVERT_OPTIONS = ("--target", "openai-strict", "--polymorphism", "anyof")
+
 
 def run_cli_conversion(binary_path, input_path, output_path, codec_path, timeout=30):
     """Convert a JSON Schema to LLM-compatible format.
@@ -31,13 +65,17 @@ def run_cli_conversion(binary_path, input_path, output_path, codec_path, timeout
         output_path,
         "--codec",
         codec_path,
-        "--target",
-        "openai-strict",
-        "--polymorphism",
-        "anyof",
+        *_CONVERT_OPTIONS,
     ]
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        # Output goes to --output; only stderr is worth capturing.
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=timeout,
+        )
         if result.returncode != 0:
             return False, result.stderr, False
         return True, result.stderr, False
@@ -71,7 +109,14 @@ def run_cli_rehydration(
     if schema_path:
         cmd.extend(["--schema", schema_path])
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        # Output goes to --output; only stderr is worth capturing.
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=timeout,
+        )
         if result.returncode != 0:
             return False, result.stderr, False
         return True, result.stderr, False
@@ -79,26 +124,82 @@ def run_cli_rehydration(
         return False, f"Timed out after {timeout}s", True
 
 
+_SCHEMA_NAME_INVALID = re.compile(r"[^a-zA-Z0-9_-]")
+
+
+@functools.lru_cache(maxsize=512)
 def _sanitize_schema_name(name: str) -> str:
     """Sanitize schema name for OpenAI's json_schema.name requirement.
 
-    OpenAI requires: ^[a-zA-Z0-9_-]+$ and max 64 chars.
+    OpenAI requires: ^[a-zA-Z0-9_-]+$ and max 64 chars. Cached because
+    retries send the same name again.
     """
-    sanitized = re.sub(r"[^a-zA-Z0-9_-]", "_", name)
-    return sanitized[:64]
+    return _SCHEMA_NAME_INVALID.sub("_", name)[:64]
 
 
-def call_openai(client, schema_name, schema_content, model="gpt-4o-mini", timeout=60):
+class AimdLimiter:
+    """Adaptive cap on concurrent OpenAI requests shared by all workers.
+
+    Additive increase / multiplicative decrease: every successful call
+    raises the cap by `increase` (up to `max_limit`), every throttled call
+    (HTTP 429 or 5xx) multiplies it by `decrease`, never below 1. Workers
+    block in acquire() while the cap is reached, so under rate limiting
+    the pool backs off as a whole instead of each thread retrying blindly.
+    Per-request Retry-After handling stays with the OpenAI SDK's own retry.
+    """
+
+    def __init__(self, max_limit, increase=0.5, decrease=0.5):
+        self.max_limit = float(max_limit)
+        self.limit = self.max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self._in_flight >= max(1, int(self.limit)):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, throttled=False):
+        with self._cond:
+            self._in_flight -= 1
+            if throttled:
+                self.limit = max(1.0, self.limit * self.decrease)
+            else:
+                self.limit = min(self.max_limit, self.limit + self.increase)
+            self._cond.notify_all()
+
+
+def _is_throttled(error):
+    """Whether an OpenAI exception signals server-side overload."""
+    status = getattr(error, "status_code", None)
+    return status == 429 or (isinstance(status, int) and status >= 500)
+
+
+def call_openai(
+    client,
+    schema_name,
+    schema_content,
+    model="gpt-4o-mini",
+    timeout=60,
+    limiter=None,
+):
     """Call OpenAI to generate data matching the schema.
 
     Args:
         model: OpenAI model name (default gpt-4o-mini).
         timeout: API call timeout in seconds (default 60).
+        limiter: Optional AimdLimiter gating concurrent requests.
 
     Returns:
         str or None: The response content, or None if content was empty/null.
         Returns error string prefixed with "OPENAI_ERROR:" on exception.
     """
+    if limiter is not None:
+        limiter.acquire()
+    throttled = False
     try:
         completion = client.chat.completions.create(
             model=model,
@@ -125,7 +226,52 @@ def call_openai(client, schema_name, schema_content, model="gpt-4o-mini", timeou
             return None
         return content
     except Exception as e:
+        throttled = _is_throttled(e)
         return f"OPENAI_ERROR: {str(e)}"
+    finally:
+        if limiter is not None:
+            limiter.release(throttled)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_original_schema(input_path):
+    """Parse an input schema once for all attempts that reach validation.
+
+    Loaded lazily (not before the first attempt) so an unparseable input
+    still fails at the convert stage. Inputs don't change during a run;
+    the returned dict is shared and must not be mutated. Retries of one
+    schema run back to back on one worker, so a small cache suffices.
+    """
+    return _load_json(input_path, exact=True)
+
+
+# Canonical (sorted-key) schema JSON -> validator for that schema.
+_validators = {}
+
+
+def _validator_for(schema):
+    """Return a Draft 2020-12 validator for `schema`, built once per schema.
+
+    Looked up by sorted-key JSON so structurally identical schemas share one
+    validator, including across retry attempts of the same schema. The
+    validator itself is built from `schema` as loaded: iter_errors follows
+    the schema's key order, so the first error matches an uncached run.
+    The key uses the json module, which round-trips every value json.loads
+    produces (orjson can't encode big integers and writes NaN as null).
+    """
+    key = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    validator = _validators.get(key)
+    if validator is None:
+        if isinstance(schema, dict) and "$schema" not in schema:
+            # Copy only when the dialect has to be injected; the caller's
+            # dict is shared across attempts and must not be mutated.
+            schema = {
+                **schema,
+                "$schema": "https://json-schema.org/draft/2020-12/schema",
+            }
+        # setdefault: concurrent workers racing on a new schema keep one.
+        validator = _validators.setdefault(key, jsonschema.Draft202012Validator(schema))
+    return validator
 
 
 def validate_original(data, original_schema):
@@ -134,20 +280,21 @@ def validate_original(data, original_schema):
     Uses Draft 2020-12 explicitly so newer keywords (dependentRequired,
     prefixItems, etc.) are not silently ignored.
     """
-    try:
-        schema = (
-            dict(original_schema)
-            if isinstance(original_schema, dict)
-            else original_schema
-        )
-        if isinstance(schema, dict) and "$schema" not in schema:
-            schema = dict(schema)
-            schema["$schema"] = "https://json-schema.org/draft/2020-12/schema"
-        validator = jsonschema.Draft202012Validator(schema)
-        validator.validate(instance=data)
+    # `true` and `{}` (edge_true, edge_empty) accept every instance; skip the
+    # canonical dump and validator lookup. `false` still goes through the
+    # validator so it reports jsonschema's own error.
+    if original_schema is True or original_schema == {}:
         return True, ""
-    except jsonschema.ValidationError as e:
-        return False, str(e)
+    validator = _validator_for(original_schema)
+    # Same error validator.validate() would raise (the first one), without
+    # the raise/catch round-trip on every failing instance.
+    error = next(validator.iter_errors(data), None)
+    if error is not None:
+        return False, str(error)
+    return True, ""
+
+
+_TRANSIENT_REASONS = frozenset({"api_error", "null_content", "timeout"})
 
 
 def _is_transient_failure(attempt):
@@ -156,7 +303,11 @@ def _is_transient_failure(attempt):
     Transient reasons: api_error, null_content, timeout.
     Permanent reasons: conversion_failed, rehydration_failed, schema_mismatch.
     """
-    return attempt.get("reason") in ("api_error", "null_content", "timeout")
+    return attempt.get("reason") in _TRANSIENT_REASONS
+
+
+# Set when the run is interrupted; wakes workers sleeping between retries.
+_stop_retries = threading.Event()
 
 
 def run_single_schema(
@@ -171,6 +322,7 @@ def run_single_schema(
     retries=0,
     retry_delay=2,
     max_delay=60,
+    limiter=None,
 ):
     """Run the full pipeline for a single schema, with optional retries.
 
@@ -182,9 +334,10 @@ def run_single_schema(
         retries: Number of additional attempts on failure (0 = no retries).
         retry_delay: Base delay in seconds for exponential backoff (default 2).
         max_delay: Maximum delay cap in seconds (default 60).
+        limiter: Optional AimdLimiter shared across concurrent schemas.
 
     Returns:
-        dict with keys: file, verdict, attempts.
+        dict with keys: file, base_name, verdict, attempts.
         verdict is one of: solid_pass, flaky_pass, solid_fail.
         attempts is a list of dicts with: passed, stage, reason, error.
     """
@@ -204,7 +357,8 @@ def run_single_schema(
             capped = min(max_delay, base)
             delay = random.uniform(capped * 0.75, capped * 1.25)
             delay = min(delay, max_delay)
-            time.sleep(delay)
+            if _stop_retries.wait(delay):
+                break
 
         attempt = _run_pipeline_once(
             binary_path,
@@ -218,6 +372,7 @@ def run_single_schema(
             model,
             timeout_subprocess,
             timeout_api,
+            limiter,
         )
         attempts.append(attempt)
 
@@ -228,17 +383,21 @@ def run_single_schema(
         if not _is_transient_failure(attempt):
             break
 
-    # Determine verdict
-    any_passed = any(a["passed"] for a in attempts)
-    if any_passed:
-        if attempts[0]["passed"]:
-            verdict = "solid_pass"
-        else:
-            verdict = "flaky_pass"
-    else:
+    # Determine verdict. The loop stops at the first pass, so only the last
+    # attempt can have passed.
+    if not attempts[-1]["passed"]:
         verdict = "solid_fail"
+    elif len(attempts) == 1:
+        verdict = "solid_pass"
+    else:
+        verdict = "flaky_pass"
 
-    return {"file": schema_file, "verdict": verdict, "attempts": attempts}
+    return {
+        "file": schema_file,
+        "base_name": base_name,
+        "verdict": verdict,
+        "attempts": attempts,
+    }
 
 
 def _run_pipeline_once(
@@ -253,6 +412,7 @@ def _run_pipeline_once(
     model,
     timeout_subprocess,
     timeout_api,
+    limiter=None,
 ):
     """Execute one attempt of the convert→openai→rehydrate→validate pipeline.
 
@@ -276,12 +436,16 @@ def _run_pipeline_once(
         }
 
     # Load converted schema
-    with open(converted_path) as f:
-        llm_schema = json.load(f)
+    llm_schema = _load_json(converted_path)
 
     # 2. OpenAI Call
     llm_response_str = call_openai(
-        client, base_name, llm_schema, model=model, timeout=timeout_api
+        client,
+        base_name,
+        llm_schema,
+        model=model,
+        timeout=timeout_api,
+        limiter=limiter,
     )
 
     if llm_response_str is None:
@@ -324,10 +488,8 @@ def _run_pipeline_once(
         }
 
     # 4. Validate rehydrated data against original schema
-    with open(rehydrated_path) as f:
-        rehydrated_data = json.load(f)
-    with open(input_path) as f:
-        original_schema = json.load(f)
+    rehydrated_data = _load_json(rehydrated_path, exact=True)
+    original_schema = _load_original_schema(input_path)
 
     valid, err = validate_original(rehydrated_data, original_schema)
     if not valid:
@@ -354,8 +516,7 @@ def load_expected_failures(config_path):
         SystemExit: If file not found or invalid JSON.
     """
     try:
-        with open(config_path) as f:
-            config = json.load(f)
+        config = _load_json(config_path)
     except FileNotFoundError:
         print(
             f"Error: expected-failures config not found: {config_path}", file=sys.stderr
@@ -394,13 +555,14 @@ def classify_result(result, expected_failures):
     """Classify a schema result considering the expected-failures config.
 
     Args:
-        result: dict with file, verdict, attempts.
+        result: dict with file, verdict, attempts (and base_name when it
+            comes from run_single_schema).
         expected_failures: dict from load_expected_failures, or empty dict.
 
     Returns:
         One of: solid_pass, flaky_pass, solid_fail, expected_fail, unexpected_pass.
     """
-    base_name = os.path.splitext(result["file"])[0]
+    base_name = result.get("base_name") or os.path.splitext(result["file"])[0]
 
     if base_name not in expected_failures:
         return result["verdict"]
@@ -424,6 +586,8 @@ def classify_result(result, expected_failures):
 
 
 def main():
+    # An earlier interrupted run in this process leaves the event set.
+    _stop_retries.clear()
     parser = argparse.ArgumentParser(
         description="Run stress tests for json-schema-llm CLI"
     )
@@ -469,6 +633,12 @@ def main():
         default=None,
         help="Path to expected-failures JSON config",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of schemas to run concurrently (default: 1)",
+    )
     args = parser.parse_args()
 
     if args.retries < 0:
@@ -477,11 +647,15 @@ def main():
         parser.error("--retry-delay must be >= 0")
     if args.max_delay < 0:
         parser.error("--max-delay must be >= 0")
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
 
     client = OpenAI()
 
-    schemas = [f for f in os.listdir(args.schemas) if f.endswith(".json")]
-    schemas.sort()
+    with os.scandir(args.schemas) as entries:
+        schemas = sorted(
+            e.name for e in entries if e.name.endswith(".json") and e.is_file()
+        )
 
     # Apply seed for deterministic schema ordering
     if args.seed is not None:
@@ -512,6 +686,7 @@ def main():
         "retry_delay": args.retry_delay,
         "max_delay": args.max_delay,
         "expected_failures_config": ef_path if args.expected_failures else None,
+        "workers": args.workers,
     }
 
     # Backward-compat result structure + new detailed_results
@@ -537,83 +712,112 @@ def main():
     output_dir = "stress_results"
     os.makedirs(output_dir, exist_ok=True)
 
-    for schema_file in schemas:
-        base_name = os.path.splitext(schema_file)[0]
-        max_attempts = 1 + args.retries
-
-        print(f"Testing {base_name}...", end=" ", flush=True)
-
-        result = run_single_schema(
-            binary_path=args.bin,
-            schema_file=schema_file,
-            schemas_dir=args.schemas,
-            output_dir=output_dir,
-            client=client,
-            model=args.model,
-            timeout_subprocess=args.timeout_subprocess,
-            timeout_api=args.timeout_api,
-            retries=args.retries,
-            retry_delay=args.retry_delay,
-            max_delay=args.max_delay,
-        )
+    max_attempts = 1 + args.retries
+    run_one = functools.partial(
+        run_single_schema,
+        args.bin,
+        schemas_dir=args.schemas,
+        output_dir=output_dir,
+        client=client,
+        model=args.model,
+        timeout_subprocess=args.timeout_subprocess,
+        timeout_api=args.timeout_api,
+        retries=args.retries,
+        retry_delay=args.retry_delay,
+        max_delay=args.max_delay,
+        # Shrinks OpenAI concurrency below --workers while rate limited.
+        limiter=AimdLimiter(args.workers),
+    )
 
-        # Print per-attempt progress for retries
-        if args.retries > 0 and len(result["attempts"]) > 1:
-            for i, attempt in enumerate(result["attempts"]):
-                attempt_label = f"({i + 1}/{max_attempts})"
-                separator = " → " if i < len(result["attempts"]) - 1 else ""
-                if attempt["passed"]:
-                    print(f"✅ PASS {attempt_label}{separator}", end="", flush=True)
+    # Each schema is I/O-bound (CLI subprocesses + an OpenAI round-trip), so
+    # threads overlap the waits. The OpenAI client is thread-safe and every
+    # schema writes to its own files. map() yields in submission order, which
+    # keeps console output and the report in schema order.
+    # Each classified result is also appended to a JSONL file as soon as it
+    # is known, so an interrupted run keeps the schemas it already finished.
+    progress_path = os.path.join(output_dir, "stress_results.jsonl")
+    with (
+        open(progress_path, "wb") as progress,
+        ThreadPoolExecutor(max_workers=args.workers) as executor,
+    ):
+        outcomes = executor.map(run_one, schemas)
+        try:
+            for schema_file, result in zip(schemas, outcomes):
+                base_name = result["base_name"]
+
+                # Build the whole line first so it prints in a single write.
+                line = f"Testing {base_name}... "
+
+                # Per-attempt progress for retries
+                if args.retries > 0 and len(result["attempts"]) > 1:
+                    for i, attempt in enumerate(result["attempts"]):
+                        attempt_label = f"({i + 1}/{max_attempts})"
+                        separator = " → " if i < len(result["attempts"]) - 1 else ""
+                        if attempt["passed"]:
+                            line += f"✅ PASS {attempt_label}{separator}"
+                        else:
+                            line += f"❌ FAIL {attempt_label}{separator}"
+                    line += " "
+
+                # Classify with expected failures
+                classification = classify_result(result, expected_failures)
+
+                # Console output
+                if classification == "solid_pass":
+                    print(f"{line}✅ PASS")
+                    results["pass"].append(schema_file)
+                    solid_passes.append(result)
+                elif classification == "flaky_pass":
+                    print(f"{line}Final: ⚠️ PASS (flaky)")
+                    results["pass"].append(schema_file)
+                    flaky_passes.append(result)
+                elif classification == "expected_fail":
+                    reason = expected_failures.get(base_name, {}).get(
+                        "reason", "unknown"
+                    )
+                    print(f"{line}🔇 EXPECTED FAIL ({reason})")
+                    results["fail"].append(
+                        {
+                            "file": schema_file,
+                            "stage": result["attempts"][-1].get("stage", "unknown"),
+                            "reason": "expected_fail",
+                            "error": reason,
+                        }
+                    )
+                    expected_fail_list.append(result)
+                elif classification == "unexpected_pass":
+                    print(f"{line}🚨 UNEXPECTED PASS")
+                    results["pass"].append(schema_file)
+                    unexpected_pass_list.append(result)
                 else:
-                    print(f"❌ FAIL {attempt_label}{separator}", end="", flush=True)
-            print(" ", end="")
-
-        # Classify with expected failures
-        classification = classify_result(result, expected_failures)
-
-        # Console output
-        if classification == "solid_pass":
-            print("✅ PASS")
-            results["pass"].append(schema_file)
-            solid_passes.append(result)
-        elif classification == "flaky_pass":
-            print("Final: ⚠️ PASS (flaky)")
-            results["pass"].append(schema_file)
-            flaky_passes.append(result)
-        elif classification == "expected_fail":
-            reason = expected_failures.get(base_name, {}).get("reason", "unknown")
-            print(f"🔇 EXPECTED FAIL ({reason})")
-            results["fail"].append(
-                {
-                    "file": schema_file,
-                    "stage": result["attempts"][-1].get("stage", "unknown"),
-                    "reason": "expected_fail",
-                    "error": reason,
-                }
-            )
-            expected_fail_list.append(result)
-        elif classification == "unexpected_pass":
-            print("🚨 UNEXPECTED PASS")
-            results["pass"].append(schema_file)
-            unexpected_pass_list.append(result)
-        else:
-            # solid_fail
-            last_attempt = result["attempts"][-1]
-            stage = last_attempt.get("stage", "unknown")
-            print(f"❌ {stage.upper()} FAIL")
-            results["fail"].append(
-                {
-                    "file": schema_file,
-                    "stage": stage,
-                    "reason": last_attempt.get("reason", "unknown"),
-                    "error": last_attempt.get("error", ""),
-                }
-            )
-            solid_fails.append(result)
-
-        # Add to detailed results
-        result["classification"] = classification
-        results["detailed_results"].append(result)
+                    # solid_fail
+                    last_attempt = result["attempts"][-1]
+                    stage = last_attempt.get("stage", "unknown")
+                    print(f"{line}❌ {stage.upper()} FAIL")
+                    results["fail"].append(
+                        {
+                            "file": schema_file,
+                            "stage": stage,
+                            "reason": last_attempt.get("reason", "unknown"),
+                            "error": last_attempt.get("error", ""),
+                        }
+                    )
+                    solid_fails.append(result)
+
+                # Add to detailed results
+                result["classification"] = classification
+                results["detailed_results"].append(result)
+                if orjson:
+                    progress.write(orjson.dumps(result) + b"\n")
+                else:
+                    progress.write(json.dumps(result).encode() + b"\n")
+                progress.flush()
+        except KeyboardInterrupt:
+            # Drop queued schemas and wake workers in retry backoff so the
+            # pool shuts down without waiting out their delays.
+            _stop_retries.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
     # Summary
     tested = len(schemas) - len(expected_fail_list)
@@ -631,9 +835,7 @@ def main():
     if flaky_passes:
         print(f"  ⚠️  Flaky passes: {len(flaky_passes)}")
         for r in flaky_passes:
-            print(
-                f"    {os.path.splitext(r['file'])[0]} ({len(r['attempts'])} attempts)"
-            )
+            print(f"    {r['base_name']} ({len(r['attempts'])} attempts)")
 
     if solid_fails:
         print(f"  ❌ Solid failures: {len(solid_fails)}")
@@ -649,18 +851,22 @@ def main():
     if expected_fail_list:
         print(f"  🔇 Expected failures: {len(expected_fail_list)}")
         for r in expected_fail_list:
-            name = os.path.splitext(r["file"])[0]
+            name = r["base_name"]
             reason = expected_failures.get(name, {}).get("reason", "unknown")
             print(f"    {name}: {reason}")
 
     if unexpected_pass_list:
         print(f"  🚨 Unexpected passes: {len(unexpected_pass_list)}")
         for r in unexpected_pass_list:
-            print(f"    {os.path.splitext(r['file'])[0]}")
+            print(f"    {r['base_name']}")
 
     report_path = os.path.join(output_dir, "stress_test_report.json")
-    with open(report_path, "w") as f:
-        json.dump(results, f, indent=2)
+    if orjson:
+        report = orjson.dumps(results, option=orjson.OPT_INDENT_2)
+    else:
+        report = json.dumps(results, indent=2).encode()
+    with open(report_path, "wb") as f:
+        f.write(report)
     print(f"\nResults written to {report_path}")
 
     # Exit code: fail on solid_fail or unexpected_pass
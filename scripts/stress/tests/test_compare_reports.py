@@ -269,6 +269,16 @@ class TestCompareReports:
         assert "new_failures" in parsed
         assert isinstance(parsed["new_failures"], list)
 
+    def test_json_output_sorted_regardless_of_report_order(self):
+        """--json lists "unchanged" in full; it must not follow shuffled order."""
+        mod = _load_compare_module()
+        names = ["zeta", "alpha", "mu"]
+        baseline = _make_report([_make_result(n, "solid_pass") for n in names])
+        current = _make_report([_make_result(n, "solid_pass") for n in reversed(names)])
+        result = mod.compare_reports(baseline, current)
+        parsed = json.loads(mod.format_comparison(result, json_output=True))
+        assert parsed["unchanged"] == ["alpha", "mu", "zeta"]
+
     def test_missing_file_error(self):
         """Graceful error on missing report file."""
         mod = _load_compare_module()
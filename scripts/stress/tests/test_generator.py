@@ -12,8 +12,7 @@ from pathlib import Path
 import pytest
 
 
-@pytest.fixture
-def generator_module():
+def _load_generator():
     """Import the generator module dynamically so we can patch its OUTPUT_DIR."""
     import importlib.util
 
@@ -26,14 +25,24 @@ def generator_module():
 
 
 @pytest.fixture
-def generate_to_tmpdir(generator_module):
-    """Generate schemas into a temp directory and return the path + module."""
-    mod, spec = generator_module
-    with tempfile.TemporaryDirectory() as tmpdir:
-        spec.loader.exec_module(mod)
-        mod.OUTPUT_DIR = tmpdir
-        mod.main(seed=42)
-        yield tmpdir, mod
+def generator_module():
+    """A fresh, not-yet-executed generator module and its spec."""
+    return _load_generator()
+
+
+@pytest.fixture(scope="module")
+def generate_to_tmpdir(tmp_path_factory):
+    """Generate schemas into a temp directory and return the path + module.
+
+    Generated once per module: output is deterministic and the tests using
+    this fixture only read it.
+    """
+    mod, spec = _load_generator()
+    tmpdir = str(tmp_path_factory.mktemp("stress_schemas"))
+    spec.loader.exec_module(mod)
+    mod.OUTPUT_DIR = tmpdir
+    mod.main(seed=42)
+    return tmpdir, mod
 
 
 class TestDeterminism:
@@ -96,33 +105,26 @@ class TestVariety:
 class TestComplexityMetrics:
     """G review: generated fixtures must meet minimum complexity thresholds."""
 
-    def _schema_depth(self, obj, current=0):
-        """Calculate max nesting depth of a schema."""
-        if not isinstance(obj, dict):
-            return current
-        max_d = current
-        for v in obj.values():
-            if isinstance(v, dict):
-                max_d = max(max_d, self._schema_depth(v, current + 1))
-            elif isinstance(v, list):
-                for item in v:
-                    if isinstance(item, dict):
-                        max_d = max(max_d, self._schema_depth(item, current + 1))
-        return max_d
-
-    def _node_count(self, obj):
-        """Count total key-value pairs in schema."""
-        if not isinstance(obj, dict):
-            return 0
-        count = len(obj)
-        for v in obj.values():
-            if isinstance(v, dict):
-                count += self._node_count(v)
-            elif isinstance(v, list):
-                for item in v:
-                    if isinstance(item, dict):
-                        count += self._node_count(item)
-        return count
+    def _schema_metrics(self, schema):
+        """Return (max nesting depth, total key-value pairs) of a dict schema.
+
+        Walks with an explicit stack so deep fixtures can't hit the
+        recursion limit.
+        """
+        max_depth = nodes = 0
+        stack = [(schema, 0)]
+        while stack:
+            obj, depth = stack.pop()
+            max_depth = max(max_depth, depth)
+            nodes += len(obj)
+            for v in obj.values():
+                if isinstance(v, dict):
+                    stack.append((v, depth + 1))
+                elif isinstance(v, list):
+                    stack.extend(
+                        (item, depth + 1) for item in v if isinstance(item, dict)
+                    )
+        return max_depth, nodes
 
     def test_has_deep_fixtures(self, generate_to_tmpdir):
         """At least one fixture should have depth >= 10."""
@@ -136,7 +138,7 @@ class TestComplexityMetrics:
                     except (json.JSONDecodeError, TypeError):
                         continue
                     if isinstance(schema, dict):
-                        max_depth = max(max_depth, self._schema_depth(schema))
+                        max_depth = max(max_depth, self._schema_metrics(schema)[0])
         assert max_depth >= 10, f"Max depth is only {max_depth}"
 
     def test_has_wide_fixtures(self, generate_to_tmpdir):
@@ -151,7 +153,7 @@ class TestComplexityMetrics:
                     except (json.JSONDecodeError, TypeError):
                         continue
                     if isinstance(schema, dict):
-                        max_nodes = max(max_nodes, self._node_count(schema))
+                        max_nodes = max(max_nodes, self._schema_metrics(schema)[1])
         assert max_nodes >= 20, f"Max nodes is only {max_nodes}"
 
 
@@ -186,6 +188,87 @@ class TestFilenameCorrectness:
                 )
 
 
+class TestTaggedUnion:
+    """Discriminated oneOf fixtures must map every tag to its own branch."""
+
+    def test_discriminator_mapping_resolves_to_branch(self, generate_to_tmpdir):
+        """Each mapping pointer should land on the branch pinning that tag."""
+        tmpdir, _ = generate_to_tmpdir
+        with open(os.path.join(tmpdir, "polymorphism_tagged_union.json")) as fh:
+            schema = json.load(fh)
+        node = schema["properties"]["poly_field"]
+        discriminator = node["discriminator"]
+        tag = discriminator["propertyName"]
+        assert len(discriminator["mapping"]) == len(node["oneOf"])
+        for value, pointer in discriminator["mapping"].items():
+            target = schema
+            for part in pointer.removeprefix("#/").split("/"):
+                target = target[int(part)] if isinstance(target, list) else target[part]
+            assert target["properties"][tag]["const"] == value
+
+
+class TestBoundedRecursion:
+    """Bounded recursive fixtures must be finite and match their filename."""
+
+    def test_recursive_bounded_depth_matches_filename(self, generate_to_tmpdir):
+        """recursive_bounded_N.json should unroll exactly N nodes, no $ref."""
+        tmpdir, _ = generate_to_tmpdir
+        found = [f for f in os.listdir(tmpdir) if f.startswith("recursive_bounded_")]
+        assert found, "No bounded recursive fixture generated"
+        for f in found:
+            claimed = int(f.removeprefix("recursive_bounded_").removesuffix(".json"))
+            with open(os.path.join(tmpdir, f)) as fh:
+                text = fh.read()
+            assert "$ref" not in text
+            node, levels = json.loads(text), 0
+            while node.get("type") == "object":
+                levels += 1
+                node = node["properties"]["next"]
+            assert node == {"type": "null"}
+            assert levels == claimed, f"{f}: claimed {claimed}, actual {levels}"
+
+
+class TestRegexAudit:
+    """Generated patterns must compile and not backtrack catastrophically."""
+
+    def test_rejects_catastrophic_pattern(self, generator_module):
+        """Nested quantifiers should fail generation instead of hanging."""
+        mod, spec = generator_module
+        spec.loader.exec_module(mod)
+        assert mod._audit_regex(r"^[a-z]+$") == r"^[a-z]+$"
+        for pattern in (r"^(a+)+$", r"^(\d*x)*$", r"((a+))+", r"(?:ab+|c){2,}"):
+            with pytest.raises(ValueError, match="backtracks"):
+                mod._audit_regex(pattern)
+
+    def test_accepts_bounded_or_escaped_repetition(self, generator_module):
+        """Bounded outer repeats, escapes and character classes are safe."""
+        mod, spec = generator_module
+        spec.loader.exec_module(mod)
+        for pattern in (
+            r"^([0-9a-fA-F]{1,4}:){7,7}[0-9a-fA-F]{1,4}$",
+            r"^(a+)?b$",
+            r"^\(a+\)+$",
+            r"^[(a+)]+$",
+            r"^[]a+)]+$",
+        ):
+            assert mod._audit_regex(pattern) == pattern
+
+
+class TestEncode:
+    """Fixture bytes must match json.dumps(indent=2) exactly."""
+
+    def test_floats_and_big_ints_match_json(self, generator_module):
+        mod, spec = generator_module
+        spec.loader.exec_module(mod)
+        schema = {
+            "multipleOf": 1e-7,
+            "maximum": 1e16,
+            "const": 2**70,
+            "k\u00e9": "\u00e9",
+        }
+        assert mod._encode(schema) == json.dumps(schema, indent=2).encode()
+
+
 class TestNoUnusedImports:
     """Finding #17: no unused imports in generator script."""
 
@@ -232,9 +315,7 @@ class TestCleanFlag:
             mod.OUTPUT_DIR = tmpdir
 
             # Clean: remove existing .json files
-            for existing in os.listdir(tmpdir):
-                if existing.endswith(".json"):
-                    os.remove(os.path.join(tmpdir, existing))
+            assert mod.clean_output_dir() == 1
 
             # Generate fresh
             mod.main(seed=42)
@@ -340,7 +340,9 @@ class TestRetryLogic:
                         mod, "validate_original", return_value=(True, "")
                     ):
                         with patch("builtins.open", MagicMock()):
-                            with patch("json.load", return_value={"type": "object"}):
+                            with patch.object(
+                                mod, "_load_json", return_value={"type": "object"}
+                            ):
                                 with patch("json.dump"):
                                     result = mod.run_single_schema(
                                         binary_path="/fake/bin",
@@ -377,7 +379,9 @@ class TestRetryLogic:
                         mod, "validate_original", return_value=(True, "")
                     ):
                         with patch("builtins.open", MagicMock()):
-                            with patch("json.load", return_value={"type": "object"}):
+                            with patch.object(
+                                mod, "_load_json", return_value={"type": "object"}
+                            ):
                                 with patch("json.dump"):
                                     result = mod.run_single_schema(
                                         binary_path="/fake/bin",
@@ -402,7 +406,9 @@ class TestRetryLogic:
                 mod, "call_openai", return_value="OPENAI_ERROR: always fails"
             ):
                 with patch("builtins.open", MagicMock()):
-                    with patch("json.load", return_value={"type": "object"}):
+                    with patch.object(
+                        mod, "_load_json", return_value={"type": "object"}
+                    ):
                         result = mod.run_single_schema(
                             binary_path="/fake/bin",
                             schema_file="test.json",
@@ -426,7 +432,9 @@ class TestRetryLogic:
                 mod, "call_openai", return_value="OPENAI_ERROR: fail once"
             ):
                 with patch("builtins.open", MagicMock()):
-                    with patch("json.load", return_value={"type": "object"}):
+                    with patch.object(
+                        mod, "_load_json", return_value={"type": "object"}
+                    ):
                         result = mod.run_single_schema(
                             binary_path="/fake/bin",
                             schema_file="test.json",
@@ -448,7 +456,7 @@ class TestRetryLogic:
             mod, "run_cli_conversion", return_value=(False, "conv error", False)
         ):
             with patch("builtins.open", MagicMock()):
-                with patch("json.load", return_value={"type": "object"}):
+                with patch.object(mod, "_load_json", return_value={"type": "object"}):
                     result = mod.run_single_schema(
                         binary_path="/fake/bin",
                         schema_file="test.json",
@@ -645,9 +653,13 @@ class TestExponentialBackoff:
         with patch.object(mod, "run_cli_conversion", return_value=(True, "", False)):
             with patch.object(mod, "call_openai", side_effect=fake_openai):
                 with patch("builtins.open", MagicMock()):
-                    with patch("json.load", return_value={"type": "object"}):
-                        with patch(
-                            "time.sleep", side_effect=lambda d: sleep_calls.append(d)
+                    with patch.object(
+                        mod, "_load_json", return_value={"type": "object"}
+                    ):
+                        with patch.object(
+                            mod._stop_retries,
+                            "wait",
+                            side_effect=lambda d: sleep_calls.append(d),
                         ):
                             with patch(
                                 "random.uniform", side_effect=lambda a, b: (a + b) / 2
@@ -679,9 +691,13 @@ class TestExponentialBackoff:
         with patch.object(mod, "run_cli_conversion", return_value=(True, "", False)):
             with patch.object(mod, "call_openai", side_effect=fake_openai):
                 with patch("builtins.open", MagicMock()):
-                    with patch("json.load", return_value={"type": "object"}):
-                        with patch(
-                            "time.sleep", side_effect=lambda d: sleep_calls.append(d)
+                    with patch.object(
+                        mod, "_load_json", return_value={"type": "object"}
+                    ):
+                        with patch.object(
+                            mod._stop_retries,
+                            "wait",
+                            side_effect=lambda d: sleep_calls.append(d),
                         ):
                             mod.run_single_schema(
                                 binary_path="/fake/bin",
@@ -710,9 +726,13 @@ class TestExponentialBackoff:
         with patch.object(mod, "run_cli_conversion", return_value=(True, "", False)):
             with patch.object(mod, "call_openai", side_effect=fake_openai):
                 with patch("builtins.open", MagicMock()):
-                    with patch("json.load", return_value={"type": "object"}):
-                        with patch(
-                            "time.sleep", side_effect=lambda d: sleep_calls.append(d)
+                    with patch.object(
+                        mod, "_load_json", return_value={"type": "object"}
+                    ):
+                        with patch.object(
+                            mod._stop_retries,
+                            "wait",
+                            side_effect=lambda d: sleep_calls.append(d),
                         ):
                             with patch("random.uniform", side_effect=lambda a, b: b):
                                 mod.run_single_schema(
@@ -738,7 +758,7 @@ class TestExponentialBackoff:
             mod, "run_cli_conversion", return_value=(False, "bad schema", False)
         ):
             with patch("builtins.open", MagicMock()):
-                with patch("json.load", return_value={"type": "object"}):
+                with patch.object(mod, "_load_json", return_value={"type": "object"}):
                     result = mod.run_single_schema(
                         binary_path="/fake/bin",
                         schema_file="test.json",
@@ -764,8 +784,12 @@ class TestExponentialBackoff:
                 mod, "call_openai", return_value="OPENAI_ERROR: 429 rate limit"
             ):
                 with patch("builtins.open", MagicMock()):
-                    with patch("json.load", return_value={"type": "object"}):
-                        with patch("time.sleep"):
+                    with patch.object(
+                        mod, "_load_json", return_value={"type": "object"}
+                    ):
+                        with patch.object(
+                            mod._stop_retries, "wait", return_value=False
+                        ):
                             result = mod.run_single_schema(
                                 binary_path="/fake/bin",
                                 schema_file="test.json",
@@ -779,6 +803,32 @@ class TestExponentialBackoff:
         # Should exhaust all 3 attempts (1 + 2 retries)
         assert len(result["attempts"]) == 3
 
+    def test_stop_event_cancels_pending_retries(self):
+        """Once the run is interrupted, a worker in backoff stops retrying."""
+        mod = _load_runner_module()
+        mod._stop_retries.set()
+
+        with patch.object(mod, "run_cli_conversion", return_value=(True, "", False)):
+            with patch.object(
+                mod, "call_openai", return_value="OPENAI_ERROR: 429 rate limit"
+            ):
+                with patch("builtins.open", MagicMock()):
+                    with patch.object(
+                        mod, "_load_json", return_value={"type": "object"}
+                    ):
+                        result = mod.run_single_schema(
+                            binary_path="/fake/bin",
+                            schema_file="test.json",
+                            schemas_dir="/fake/schemas",
+                            output_dir="/fake/output",
+                            client=MagicMock(),
+                            retries=3,
+                            retry_delay=60,
+                        )
+
+        assert len(result["attempts"]) == 1
+        assert result["verdict"] == "solid_fail"
+
 
 class TestTimeoutReasonCode:
     """#118: Subprocess timeouts get distinct reason code."""
@@ -792,7 +842,7 @@ class TestTimeoutReasonCode:
             mod, "run_cli_conversion", return_value=(False, "Timed out after 30s", True)
         ):
             with patch("builtins.open", MagicMock()):
-                with patch("json.load", return_value={"type": "object"}):
+                with patch.object(mod, "_load_json", return_value={"type": "object"}):
                     result = mod.run_single_schema(
                         binary_path="/fake/bin",
                         schema_file="test.json",
@@ -845,3 +895,209 @@ class TestCLIFlags118:
         """Argparser should accept --max-delay."""
         source = (Path(__file__).parent.parent / "run_cli_test.py").read_text()
         assert "--max-delay" in source, "Runner must accept --max-delay flag"
+
+
+class TestConcurrency:
+    """Schemas can run concurrently behind --workers."""
+
+    def test_workers_cli_flag(self):
+        """Argparser should accept --workers."""
+        source = (Path(__file__).parent.parent / "run_cli_test.py").read_text()
+        assert "--workers" in source, "Runner must accept --workers flag"
+
+    def test_main_runs_every_schema_in_order(self, tmp_path, monkeypatch):
+        """--workers 2 overlaps schemas but reports them in schema order."""
+        import json
+        import sys
+        import threading
+        import time
+
+        mod = _load_runner_module()
+        schemas_dir = tmp_path / "schemas"
+        schemas_dir.mkdir()
+        names = [f"s{i}" for i in range(6)]
+        for name in names:
+            (schemas_dir / f"{name}.json").write_text("{}")
+
+        started = threading.Barrier(2, timeout=5)
+        calls = []
+
+        def fake_run(binary_path, schema_file, **kwargs):
+            index = int(schema_file[1])
+            calls.append(schema_file)
+            if index < 2:
+                # Both workers must be inside a schema at the same time.
+                started.wait()
+            # Later schemas finish first, to scramble completion order.
+            time.sleep(0.01 * (len(names) - index))
+            return {
+                "file": schema_file,
+                "base_name": schema_file.removesuffix(".json"),
+                "verdict": "solid_pass",
+                "attempts": [{"passed": True, "stage": None, "reason": None}],
+            }
+
+        monkeypatch.chdir(tmp_path)
+        argv = ["run_cli_test.py", "--bin", "/fake/bin"]
+        argv += ["--schemas", str(schemas_dir), "--workers", "2"]
+        with patch.object(sys, "argv", argv):
+            with patch.object(mod, "run_single_schema", side_effect=fake_run):
+                mod.main()
+
+        assert sorted(calls) == [f"{n}.json" for n in names]
+        report_path = tmp_path / "stress_results" / "stress_test_report.json"
+        report = json.loads(report_path.read_text())
+        assert report["metadata"]["workers"] == 2
+        assert [r["file"] for r in report["detailed_results"]] == [
+            f"{n}.json" for n in names
+        ]
+        assert report["pass"] == [f"{n}.json" for n in names]
+        progress = tmp_path / "stress_results" / "stress_results.jsonl"
+        lines = progress.read_text().splitlines()
+        assert [json.loads(line)["file"] for line in lines] == report["pass"]
+
+    def test_main_clears_stop_event_from_earlier_run(self, tmp_path, monkeypatch):
+        """A stop left set by an interrupted run must not disable retries."""
+        import sys
+
+        mod = _load_runner_module()
+        schemas_dir = tmp_path / "schemas"
+        schemas_dir.mkdir()
+        (schemas_dir / "s0.json").write_text("{}")
+        mod._stop_retries.set()
+        seen = []
+
+        def fake_run(binary_path, schema_file, **kwargs):
+            seen.append(mod._stop_retries.is_set())
+            return {
+                "file": schema_file,
+                "base_name": schema_file.removesuffix(".json"),
+                "verdict": "solid_pass",
+                "attempts": [{"passed": True, "stage": None, "reason": None}],
+            }
+
+        monkeypatch.chdir(tmp_path)
+        argv = ["run_cli_test.py", "--bin", "/fake/bin", "--schemas", str(schemas_dir)]
+        with patch.object(sys, "argv", argv):
+            with patch.object(mod, "run_single_schema", side_effect=fake_run):
+                mod.main()
+
+        assert seen == [False]
+
+
+class TestAimdLimiter:
+    """OpenAI concurrency backs off on throttling and recovers on success."""
+
+    def test_throttle_halves_and_success_recovers(self):
+        """429 halves the cap (floor 1); successes add back up to the max."""
+        mod = _load_runner_module()
+        limiter = mod.AimdLimiter(8)
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(throttled=True)
+        assert limiter.limit == 1.0
+        for _ in range(20):
+            limiter.acquire()
+            limiter.release()
+        assert limiter.limit == 8.0
+
+    def test_call_openai_reports_rate_limit_to_limiter(self):
+        """A 429 from the client should shrink the shared limit."""
+        mod = _load_runner_module()
+
+        class RateLimited(Exception):
+            status_code = 429
+
+        client = MagicMock()
+        client.chat.completions.create.side_effect = RateLimited("slow down")
+        limiter = mod.AimdLimiter(4)
+        result = mod.call_openai(client, "s", {"type": "object"}, limiter=limiter)
+        assert result.startswith("OPENAI_ERROR")
+        assert limiter.limit == 2.0
+
+    def test_non_throttle_error_does_not_shrink(self):
+        """Client-side errors (e.g. 400) are not backpressure."""
+        mod = _load_runner_module()
+
+        class BadRequest(Exception):
+            status_code = 400
+
+        client = MagicMock()
+        client.chat.completions.create.side_effect = BadRequest("bad schema")
+        limiter = mod.AimdLimiter(4)
+        mod.call_openai(client, "s", {"type": "object"}, limiter=limiter)
+        assert limiter.limit == 4.0
+
+
+class TestOriginalSchemaLoading:
+    """The original schema is parsed once per input, not once per attempt."""
+
+    def test_original_schema_loaded_once(self):
+        """Repeated validation of one input reuses the parsed schema."""
+        mod = _load_runner_module()
+        with patch.object(mod, "_load_json", return_value={"type": "object"}) as load:
+            first = mod._load_original_schema("/fake/schemas/a.json")
+            second = mod._load_original_schema("/fake/schemas/a.json")
+        assert first is second
+        assert load.call_count == 1
+
+
+class TestValidatorCache:
+    """Cached validators must behave like one built from the schema as loaded."""
+
+    def test_first_error_follows_schema_key_order(self):
+        """The cache key is sorted JSON; the validator must not be built from it."""
+        mod = _load_runner_module()
+        # Sorted order would check minProperties before required.
+        schema = {"required": ["a"], "minProperties": 2}
+
+        valid, err = mod.validate_original({}, schema)
+
+        assert not valid
+        assert err.startswith("'a' is a required property")
+
+    def test_validator_reused_for_equal_schemas(self):
+        mod = _load_runner_module()
+        first = mod._validator_for({"type": "object", "required": ["a"]})
+        second = mod._validator_for({"required": ["a"], "type": "object"})
+        assert first is second
+
+    def test_caller_schema_not_mutated(self):
+        mod = _load_runner_module()
+        schema = {"type": "string"}
+        mod.validate_original(1, schema)
+        assert schema == {"type": "string"}
+
+
+class TestLoadJson:
+    """_load_json must read everything the json module reads, unchanged."""
+
+    def test_non_finite_numbers_fall_back_to_json(self, tmp_path):
+        mod = _load_runner_module()
+        path = tmp_path / "schema.json"
+        path.write_text('{"maximum": Infinity, "minimum": 1e400}')
+        data = mod._load_json(str(path))
+        assert data == {"maximum": float("inf"), "minimum": float("inf")}
+
+    def test_exact_keeps_wide_integers(self, tmp_path):
+        mod = _load_runner_module()
+        path = tmp_path / "schema.json"
+        path.write_text('{"const": 18446744073709551617}')
+        assert mod._load_json(str(path), exact=True) == {"const": 2**64 + 1}
+
+    def test_original_schema_loaded_exactly(self, tmp_path):
+        mod = _load_runner_module()
+        path = tmp_path / "schema.json"
+        path.write_text('{"const": 18446744073709551617}')
+        schema = mod._load_original_schema(str(path))
+        assert mod.validate_original(2**64 + 1, schema) == (True, "")
+        assert mod.validate_original(2**64, schema)[0] is False
+
+    def test_invalid_json_still_raises(self, tmp_path):
+        import json
+
+        mod = _load_runner_module()
+        path = tmp_path / "bad.json"
+        path.write_text('{"a": ')
+        with pytest.raises(json.JSONDecodeError):
+            mod._load_json(str(path))